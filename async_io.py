@@ -0,0 +1,74 @@
+# Shared bounded thread pool for blocking work (files, SQLite, parsing) called from async code
+import asyncio
+import contextvars
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from phase_profiler import profiled
+
+T = TypeVar("T")
+
+IO_WORKERS = int(os.getenv("IO_WORKERS", "8"))
+
+
+class IOPool:
+    """Runs blocking calls on a fixed number of threads.
+
+    Every handler and pipeline phase goes through one pool, so a slow disk or
+    a long SQLite transaction ties up at most `workers` threads and never the
+    event loop itself. The executor is created lazily, after uvicorn forks.
+    """
+
+    def __init__(self, workers: int = IO_WORKERS, name: str = "io"):
+        self.workers = max(1, workers)
+        self.name = name
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.running = 0
+        self.completed = 0
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix=self.name)
+            return self._executor
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Await func(*args, **kwargs) on the pool (context variables carried over, like to_thread)"""
+        loop = asyncio.get_running_loop()
+        call = functools.partial(contextvars.copy_context().run, profiled(func), *args, **kwargs)
+        self.submitted += 1
+        self.running += 1
+        try:
+            return await loop.run_in_executor(self.executor, call)
+        finally:
+            self.running -= 1
+            self.completed += 1
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "workers": self.workers,
+            "running": min(self.running, self.workers),
+            "queued": max(self.running - self.workers, 0),
+            "submitted": self.submitted,
+            "completed": self.completed
+        }
+
+
+io_pool = IOPool()
+
+
+async def run_io(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking call on the shared I/O pool"""
+    return await io_pool.run(func, *args, **kwargs)
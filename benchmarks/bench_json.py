@@ -0,0 +1,69 @@
+# Encode/decode throughput and payload size: stdlib json vs the fast_json layer
+#
+#   python benchmarks/bench_json.py [num_matches]
+#
+# "stdlib indent=2" is how artifacts used to be written, "FastAPI default" is
+# what returning a dict from an endpoint costs (jsonable_encoder + JSONResponse).
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+
+import fast_json  # noqa: E402
+from match_store import MatchStore  # noqa: E402
+from prediction_engine import BatchPredictor  # noqa: E402
+from vault_stats import VaultStats  # noqa: E402
+from bench_match_store import make_matches  # noqa: E402
+
+
+def best_of(func, repeat: int = 5) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def payloads(count: int):
+    matches = make_matches(count)
+    store = MatchStore()
+    store.extend(matches)
+    predictions = BatchPredictor(store).predictions()
+    return {
+        "live page (200)": {"status": "success", "data": matches[:200], "has_more": True},
+        "predictions batch (100)": {"status": "success", "data": {p["match_id"]: p for p in predictions[:100]}},
+        "vault stats": {"status": "success", "data": VaultStats.from_matches(matches).to_dict()},
+        f"predictions artifact ({count:,})": predictions
+    }
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    encoders = {
+        "stdlib indent=2": lambda obj: json.dumps(obj, indent=2).encode(),
+        "FastAPI default": lambda obj: JSONResponse(jsonable_encoder(obj)).body,
+        f"fast_json ({fast_json.BACKEND})": fast_json.dumps
+    }
+
+    print(f"backend: {fast_json.BACKEND}")
+    for name, payload in payloads(count).items():
+        print(f"\n{name}")
+        baseline = None
+        for label, encode in encoders.items():
+            body = encode(payload)
+            encode_secs = best_of(lambda: encode(payload))
+            decode_secs = best_of(lambda: fast_json.loads(body) if label.startswith("fast_json") else json.loads(body))
+            baseline = baseline or encode_secs
+            print(f"  {label:20} encode {encode_secs * 1000:8.2f} ms ({baseline / encode_secs:5.1f}x)"
+                  f"  decode {decode_secs * 1000:8.2f} ms"
+                  f"  {len(body) / 1024:9.1f} KB  {len(body) / encode_secs / 1e6:7.1f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# Memory/parse benchmark: list of match dicts vs the columnar MatchStore
+#
+#   python benchmarks/bench_match_store.py [num_matches]
+import json
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from match_store import MatchStore  # noqa: E402
+
+TEAMS = ["Real Madrid", "Barcelona", "Arsenal", "Chelsea", "Man City", "Man United",
+         "Liverpool", "Atletico", "Bayern", "Dortmund", "Inter", "Juventus"]
+PLAYERS = [f"Player{i:03d}" for i in range(80)]
+
+
+def make_matches(count: int, seed: int = 7):
+    rng = random.Random(seed)
+    matches = []
+    for i in range(count):
+        home, away = rng.sample(TEAMS, 2)
+        matches.append({
+            "match_id": f"GT_{i:08d}",
+            "home_team": home,
+            "away_team": away,
+            "home_player": rng.choice(PLAYERS),
+            "away_player": rng.choice(PLAYERS),
+            "date": f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            "status": rng.choice(["finished", "finished", "finished", "scheduled", "live"]),
+            "winner_tag": rng.choice(["HOME", "AWAY", "TIE"]),
+            "total_goals": rng.randint(0, 9),
+            "league": "GT League"
+        })
+    return matches
+
+
+def measure(build):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current, elapsed
+
+
+def load_store(text: str) -> MatchStore:
+    store = MatchStore()
+    store.extend(json.loads(text))
+    return store
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    text = json.dumps(make_matches(count))
+
+    # Matches held by a reader: the parsed dicts, or the columns built from them
+    _, dict_bytes, dict_secs = measure(lambda: json.loads(text))
+    _, store_bytes, store_secs = measure(lambda: load_store(text))
+
+    print(f"matches:              {count:,}")
+    print(f"dict list memory:     {dict_bytes / 1e6:8.1f} MB  load {dict_secs * 1000:8.1f} ms")
+    print(f"MatchStore memory:    {store_bytes / 1e6:8.1f} MB  load {store_secs * 1000:8.1f} ms")
+    print(f"memory saved:         {(1 - store_bytes / dict_bytes) * 100:8.1f} %")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+# Throughput benchmark for the vectorized BatchPredictor
+#
+#   python benchmarks/bench_predictions.py [num_matches]
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from match_store import MatchStore  # noqa: E402
+from prediction_engine import BatchPredictor  # noqa: E402
+from bench_match_store import make_matches  # noqa: E402
+
+
+def best_of(func, repeat: int = 5) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    store = MatchStore()
+    store.extend(make_matches(count))
+    predictor = BatchPredictor(store)
+
+    score_secs = best_of(predictor.score)
+    records_secs = best_of(predictor.predictions)
+
+    print(f"matches:            {count:,}")
+    print(f"vectorized scoring: {score_secs * 1000:8.1f} ms  ({count / score_secs:,.0f} matches/sec)")
+    print(f"score + records:    {records_secs * 1000:8.1f} ms  ({count / records_secs:,.0f} matches/sec)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+# Benchmark suite: pipeline phases, the dashboard parser and the /api handlers at several vault scales
+#
+#   python benchmarks/bench_suite.py [--scales 10x100,50x1000,200x1000] [--requests 200]
+#                                    [--output results.json] [--compare previous.json]
+#
+# Every scale (files x matches per file) runs in a fresh interpreter against
+# its own scratch tree and a deterministic synthetic vault (synthetic_vault.py),
+# so numbers from different commits are comparable. Results are written as
+# JSON; --compare prints the change against an earlier results file.
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import fast_json  # noqa: E402
+from system_sampler import percentile  # noqa: E402
+from synthetic_vault import dashboard_html, make_file_matches, write_vault  # noqa: E402
+
+DEFAULT_SCALES = "10x100,50x1000,200x1000"
+PARSER_MAX_ROWS = 2000
+
+
+def parse_scale(text: str) -> Tuple[int, int]:
+    files, matches = text.lower().split("x")
+    return int(files), int(matches)
+
+
+def latency_summary(latencies: List[float], first: float) -> Dict:
+    ms = sorted(value * 1000 for value in latencies)
+    return {
+        "requests": len(ms),
+        "first_ms": round(first * 1000, 3),
+        "mean_ms": round(statistics.fmean(ms), 3),
+        "p50_ms": round(percentile(ms, 0.50), 3),
+        "p95_ms": round(percentile(ms, 0.95), 3),
+        "p99_ms": round(percentile(ms, 0.99), 3),
+        "max_ms": round(ms[-1], 3),
+        "rps": round(len(ms) / (sum(ms) / 1000), 1)
+    }
+
+
+async def timed(coroutine) -> Dict:
+    start = time.perf_counter()
+    ok = await coroutine
+    return {"seconds": round(time.perf_counter() - start, 4), "ok": bool(ok)}
+
+
+# --- one scale, inside a worker interpreter ---------------------------------
+
+def api_requests(files: int, matches: int) -> List[Tuple[str, str, str, Dict]]:
+    """(name, method, path, kwargs) for every benchmarked handler"""
+    ids = [f"GT_{i % files:05d}_{i // files % matches:06d}" for i in range(100)]
+    return [
+        ("live-matches first page", "GET", "/api/live-matches", {"params": {"limit": 200}}),
+        ("live-matches filtered", "GET", "/api/live-matches",
+         {"params": {"status": "finished", "league": "GT League", "team": "Arsenal", "limit": 50}}),
+        ("prediction single", "GET", f"/api/predictions/{ids[0]}", {}),
+        ("predictions batch (100)", "POST", "/api/predictions/batch", {"json": {"match_ids": ids}}),
+        ("vault-stats", "GET", "/api/vault-stats", {}),
+        ("neural-metrics", "GET", "/api/neural-metrics", {})
+    ]
+
+
+async def bench_api(api_server, files: int, matches: int, requests: int) -> Dict:
+    import httpx
+
+    results = {}
+    transport = httpx.ASGITransport(app=api_server.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for name, method, path, kwargs in api_requests(files, matches):
+            start = time.perf_counter()
+            response = await client.request(method, path, **kwargs)
+            first = time.perf_counter() - start
+            response.raise_for_status()
+            latencies = []
+            for _ in range(requests):
+                start = time.perf_counter()
+                response = await client.request(method, path, **kwargs)
+                latencies.append(time.perf_counter() - start)
+            results[name] = {**latency_summary(latencies, first), "bytes": len(response.content)}
+
+        # Revalidation of an unchanged dataset answers 304 without a body
+        etag = (await client.get("/api/vault-stats")).headers.get("etag")
+        if etag:
+            latencies = []
+            for _ in range(requests):
+                start = time.perf_counter()
+                response = await client.get("/api/vault-stats", headers={"If-None-Match": etag})
+                latencies.append(time.perf_counter() - start)
+            results["vault-stats (304)"] = latency_summary(latencies, latencies[0])
+    return results
+
+
+def bench_parser(scratch: Path, rows: int) -> Dict:
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            import gt_scraper_dashboard
+    except (ImportError, SystemExit):
+        return {"skipped": "gt_scraper_dashboard needs playwright and beautifulsoup4"}
+    data_dir = scratch / "scraper"
+    data_dir.mkdir()
+    (data_dir / "gt_dashboard_latest.html").write_text(dashboard_html(rows), encoding="utf-8")
+    gt_scraper_dashboard.WEB_DATA_FOLDER = data_dir
+
+    timings = []
+    for _ in range(3):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            fixtures, _ = asyncio.run(gt_scraper_dashboard.run_parser())
+            timings.append(time.perf_counter() - start)
+    return {"seconds": round(min(timings), 4), "rows": rows, "fixtures": len(fixtures)}
+
+
+def run_worker(scale: str, seed: int, requests: int, output: Path):
+    files, matches = parse_scale(scale)
+    with tempfile.TemporaryDirectory(prefix="strikerbot_suite_") as scratch:
+        scratch = Path(scratch)
+        # Point the app (and the scraper's relative data folder) at the scratch tree before importing
+        os.environ["STRIKERBOT_WORK_DIR"] = str(scratch / "work")
+        os.environ["STRIKERBOT_STATE_DIR"] = str(scratch / "state")
+        os.chdir(scratch)
+        import api_server
+
+        start = time.perf_counter()
+        write_vault(api_server.VAULT_DIR, files, matches, seed)
+        generate_seconds = time.perf_counter() - start
+
+        async def pipeline() -> Dict:
+            timings = {
+                "process_vault_data (full)": await timed(api_server.process_vault_data()),
+                "process_vault_data (unchanged)": await timed(api_server.process_vault_data())
+            }
+            # Rewrite one file with different content: the incremental path
+            changed = make_file_matches(0, matches, seed + 1)
+            (api_server.VAULT_DIR / "vault_00000.json").write_text(json.dumps(changed))
+            timings["process_vault_data (one file changed)"] = await timed(api_server.process_vault_data())
+            timings["generate_predictions"] = await timed(api_server.generate_predictions())
+            return timings
+
+        timings = asyncio.run(pipeline())
+        failed = [name for name, timing in timings.items() if not timing["ok"]]
+        if failed:
+            raise SystemExit(f"{', '.join(failed)} failed: {api_server.pipeline_status['stage']}")
+        api = asyncio.run(bench_api(api_server, files, matches, requests))
+        parser = bench_parser(scratch, min(matches, PARSER_MAX_ROWS))
+
+    result = {
+        "scale": {"files": files, "matches_per_file": matches, "matches": files * matches},
+        "generate_seconds": round(generate_seconds, 4),
+        "pipeline": timings,
+        "run_parser": parser,
+        "api": api,
+        # ru_maxrss is KB on Linux
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+    }
+    output.write_text(json.dumps(result))
+
+
+# --- driver -----------------------------------------------------------------
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=Path(__file__).resolve().parent, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def flatten(result: Dict) -> Dict[str, float]:
+    """metric name -> headline number (seconds for phases, p50 ms for handlers)"""
+    values = {f"pipeline/{name}": timing["seconds"] for name, timing in result["pipeline"].items()}
+    if "seconds" in result["run_parser"]:
+        values["run_parser"] = result["run_parser"]["seconds"]
+    values.update({f"api/{name} p50_ms": timing["p50_ms"] for name, timing in result["api"].items()})
+    values.update({f"api/{name} p99_ms": timing["p99_ms"] for name, timing in result["api"].items()})
+    values["peak_rss_mb"] = result["peak_rss_mb"]
+    return values
+
+
+def print_result(result: Dict, previous: Dict = None):
+    scale = result["scale"]
+    print(f"\n{scale['files']} files x {scale['matches_per_file']} matches ({scale['matches']:,})")
+    old = flatten(previous) if previous else {}
+    for name, value in flatten(result).items():
+        line = f"  {name:48} {value:10.4f}"
+        if name in old and old[name]:
+            line += f"   was {old[name]:10.4f}  ({value / old[name]:5.2f}x)"
+        print(line)
+    if "skipped" in result["run_parser"]:
+        print(f"  run_parser skipped: {result['run_parser']['skipped']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="StrikerBot benchmark suite")
+    parser.add_argument("--scales", default=DEFAULT_SCALES, help="comma-separated FILESxMATCHES, e.g. 10x100,50x1000")
+    parser.add_argument("--requests", type=int, default=200, help="timed requests per API handler")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", type=Path, default=Path("benchmark_results.json"))
+    parser.add_argument("--compare", type=Path, help="earlier results file to compare against")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    parser.add_argument("--worker-output", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.worker, args.seed, args.requests, args.worker_output)
+        return
+
+    previous = {}
+    if args.compare:
+        for result in json.loads(args.compare.read_text())["results"]:
+            previous[(result["scale"]["files"], result["scale"]["matches_per_file"])] = result
+
+    results = []
+    for scale in args.scales.split(","):
+        parse_scale(scale)
+        with tempfile.NamedTemporaryFile(suffix=".json") as worker_output:
+            subprocess.run([sys.executable, str(Path(__file__).resolve()), "--worker", scale,
+                            "--seed", str(args.seed), "--requests", str(args.requests),
+                            "--worker-output", worker_output.name], check=True)
+            result = json.loads(Path(worker_output.name).read_text())
+        results.append(result)
+        print_result(result, previous.get((result["scale"]["files"], result["scale"]["matches_per_file"])))
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "json_backend": fast_json.BACKEND,
+            "seed": args.seed,
+            "requests_per_handler": args.requests
+        },
+        "results": results
+    }
+    args.output.write_text(json.dumps(report, indent=2))
+    print(f"\nwrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
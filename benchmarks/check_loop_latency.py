@@ -0,0 +1,94 @@
+# Concurrency check: /ping latency while a large vault is processed
+#
+#   python benchmarks/check_loop_latency.py [num_files] [records_per_file] [--max-p95-ms 50]
+#
+# Pings the app in-process every 10 ms, first idle and then while
+# process_vault_data and generate_predictions run on the same event loop.
+# Exits non-zero when the p95 under load exceeds --max-p95-ms, i.e. when
+# blocking work has crept back onto the event loop.
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from system_sampler import percentile  # noqa: E402
+from synthetic_vault import write_vault  # noqa: E402
+
+
+def summary(label: str, latencies):
+    ms = sorted(value * 1000 for value in latencies)
+    print(f"{label:18} n={len(ms):5}  p50 {statistics.median(ms):7.2f} ms  p95 {percentile(ms, 0.95):7.2f} ms"
+          f"  p99 {percentile(ms, 0.99):7.2f} ms  max {max(ms):7.2f} ms")
+    return percentile(ms, 0.95)
+
+
+async def ping_until(client, done: asyncio.Event, interval: float = 0.01):
+    latencies = []
+    while not done.is_set():
+        start = time.perf_counter()
+        response = await client.get("/ping")
+        latencies.append(time.perf_counter() - start)
+        assert response.status_code == 200
+        await asyncio.sleep(interval)
+    return latencies
+
+
+async def run_check(api_server, idle_seconds: float):
+    import httpx
+
+    transport = httpx.ASGITransport(app=api_server.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        done = asyncio.Event()
+        idle = asyncio.create_task(ping_until(client, done))
+        await asyncio.sleep(idle_seconds)
+        done.set()
+        idle_latencies = await idle
+
+        done = asyncio.Event()
+        loaded = asyncio.create_task(ping_until(client, done))
+        start = time.perf_counter()
+        processed = await api_server.process_vault_data()
+        predicted = await api_server.generate_predictions()
+        elapsed = time.perf_counter() - start
+        done.set()
+        loaded_latencies = await loaded
+
+    if not (processed and predicted):
+        raise SystemExit(f"pipeline failed: {api_server.pipeline_status['stage']}")
+    return idle_latencies, loaded_latencies, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("files", nargs="?", type=int, default=400)
+    parser.add_argument("records", nargs="?", type=int, default=500)
+    parser.add_argument("--max-p95-ms", type=float, default=50.0)
+    parser.add_argument("--idle-seconds", type=float, default=2.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="strikerbot_bench_") as scratch:
+        # Point the app at a scratch tree before it is imported
+        os.environ["STRIKERBOT_WORK_DIR"] = str(Path(scratch) / "work")
+        os.environ["STRIKERBOT_STATE_DIR"] = str(Path(scratch) / "state")
+        import api_server
+
+        write_vault(api_server.VAULT_DIR, args.files, args.records)
+        idle, loaded, elapsed = asyncio.run(run_check(api_server, args.idle_seconds))
+
+    print(f"vault: {args.files} files x {args.records} records, processed + predicted in {elapsed:.2f} s")
+    summary("idle /ping", idle)
+    p95 = summary("under load /ping", loaded)
+    if p95 > args.max_p95_ms:
+        print(f"FAIL: p95 {p95:.2f} ms exceeds {args.max_p95_ms} ms")
+        sys.exit(1)
+    print("OK: /ping latency stayed flat")
+
+
+if __name__ == "__main__":
+    main()
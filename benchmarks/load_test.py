@@ -0,0 +1,322 @@
+# Load test: drive the API at a fixed concurrency and request mix, optionally while a pipeline runs
+#
+#   python benchmarks/load_test.py [--concurrency 16] [--duration 20] [--mix live-matches=4,predictions=3,vault-stats=2,status=1]
+#                                  [--files 50] [--matches 1000] [--pipeline] [--output load.json]
+#                                  [--uvicorn [--server-workers 1] | --url http://127.0.0.1:8000 --admin-key KEY]
+#
+# By default the app runs in-process (httpx ASGI transport, same event loop),
+# which measures the handlers and the loop without network overhead. --uvicorn
+# serves the same scratch tree from a local uvicorn subprocess; --url targets a
+# server that is already running. Each of the `concurrency` clients sends its
+# next request as soon as the previous one returns (closed loop).
+#
+# --pipeline starts a pipeline a third of the way in (the vault is rewritten
+# first so every file is re-read) and reports latency outside and during it.
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from system_sampler import percentile  # noqa: E402
+from synthetic_vault import LEAGUES, TEAMS, write_vault  # noqa: E402
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_MIX = "live-matches=4,predictions=3,vault-stats=2,status=1"
+
+Request = Tuple[str, str, Dict]
+
+
+def request_builders(files: int, matches: int, admin_key: str) -> Dict[str, Callable[[random.Random], Request]]:
+    """Mix name -> function building (method, path, kwargs) for one request"""
+    admin = {"Authorization": f"Bearer {admin_key}"}
+
+    def match_id(rng: random.Random) -> str:
+        return f"GT_{rng.randrange(files):05d}_{rng.randrange(matches):06d}"
+
+    def live_matches(rng):
+        params = {"limit": rng.choice((20, 50, 200))}
+        if rng.random() < 0.5:
+            params.update(rng.choice([{"status": "finished"}, {"status": "live"}, {"league": rng.choice(LEAGUES)},
+                                      {"team": rng.choice(TEAMS)}]))
+        return "GET", "/api/live-matches", {"params": params}
+
+    def predictions(rng):
+        if rng.random() < 0.7:
+            return "GET", f"/api/predictions/{match_id(rng)}", {}
+        return "POST", "/api/predictions/batch", {"json": {"match_ids": [match_id(rng) for _ in range(rng.randint(10, 100))]}}
+
+    return {
+        "live-matches": live_matches,
+        "predictions": predictions,
+        "vault-stats": lambda rng: ("GET", "/api/vault-stats", {}),
+        "status": lambda rng: ("GET", "/status", {"headers": admin})
+    }
+
+
+def parse_mix(text: str, available) -> Dict[str, float]:
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        if name not in available:
+            raise SystemExit(f"unknown request type {name!r} (choose from {', '.join(available)})")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def summarize(samples: List[Tuple[str, float, float, bool]], seconds: float) -> Dict:
+    ms = sorted(elapsed * 1000 for _, _, elapsed, _ in samples)
+    if not ms:
+        return {"requests": 0}
+    return {
+        "requests": len(ms),
+        "errors": sum(1 for *_, ok in samples if not ok),
+        "throughput_rps": round(len(ms) / seconds, 1) if seconds else None,
+        "mean_ms": round(statistics.fmean(ms), 3),
+        "p50_ms": round(percentile(ms, 0.50), 3),
+        "p95_ms": round(percentile(ms, 0.95), 3),
+        "p99_ms": round(percentile(ms, 0.99), 3),
+        "max_ms": round(ms[-1], 3)
+    }
+
+
+def report(samples: List[Tuple[str, float, float, bool]], started: float, finished: float) -> Dict:
+    by_type = {}
+    for name in sorted({sample[0] for sample in samples}):
+        by_type[name] = summarize([sample for sample in samples if sample[0] == name], finished - started)
+    return {"overall": summarize(samples, finished - started), "by_type": by_type}
+
+
+async def client_loop(client, builders, mix: Dict[str, float], deadline: float, samples: List, seed: int):
+    import httpx
+
+    rng = random.Random(seed)
+    names, weights = list(mix), list(mix.values())
+    while time.perf_counter() < deadline:
+        name = rng.choices(names, weights)[0]
+        method, path, kwargs = builders[name](rng)
+        start = time.perf_counter()
+        try:
+            response = await client.request(method, path, **kwargs)
+            ok = response.status_code < 400 and not (response.headers.get("content-type", "").startswith("application/json")
+                                                      and response.json().get("status") == "error")
+        except httpx.HTTPError:
+            ok = False
+        samples.append((name, start, time.perf_counter() - start, ok))
+
+
+# --- pipelines running next to the load ------------------------------------
+
+async def in_process_pipeline(api_server, files: int, matches: int, seed: int) -> Dict:
+    start = time.perf_counter()
+    # Blocking file writes go to a thread so they do not stall the clients
+    await asyncio.to_thread(write_vault, api_server.VAULT_DIR, files, matches, seed + 1)
+    processed = await api_server.process_vault_data()
+    predicted = await api_server.generate_predictions()
+    return {"ok": processed and predicted, "started": start, "finished": time.perf_counter()}
+
+
+async def remote_pipeline(client, admin_key: str, vault_dir: Optional[Path], files: int, matches: int, seed: int) -> Dict:
+    start = time.perf_counter()
+    if vault_dir is not None:
+        await asyncio.to_thread(write_vault, vault_dir, files, matches, seed + 1)
+    headers = {"Authorization": f"Bearer {admin_key}"}
+    ok = True
+    for phase in ("data-processing", "predictions"):
+        job = (await client.post(f"/run-phase/{phase}", params={"force": "true"}, headers=headers)).json()
+        if job.get("status") != "started":
+            return {"ok": False, "error": job, "started": start, "finished": time.perf_counter()}
+        while True:
+            state = (await client.get(f"/jobs/{job['job_id']}", headers=headers)).json()["data"]
+            if state["status"] not in ("queued", "running"):
+                ok = ok and state["status"] == "succeeded"
+                break
+            await asyncio.sleep(0.2)
+    return {"ok": ok, "started": start, "finished": time.perf_counter()}
+
+
+# --- setup ------------------------------------------------------------------
+
+def prepare_tree(scratch: Path, files: int, matches: int, seed: int):
+    """Scratch app tree with a processed synthetic vault; returns the imported api_server"""
+    os.environ["STRIKERBOT_WORK_DIR"] = str(scratch / "work")
+    os.environ["STRIKERBOT_STATE_DIR"] = str(scratch / "state")
+    import api_server
+
+    write_vault(api_server.VAULT_DIR, files, matches, seed)
+
+    async def build():
+        if not (await api_server.process_vault_data() and await api_server.generate_predictions()):
+            raise SystemExit(f"pipeline failed: {api_server.pipeline_status['stage']}")
+
+    asyncio.run(build())
+    return api_server
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_uvicorn(scratch: Path, workers: int) -> Tuple[subprocess.Popen, str]:
+    import httpx
+
+    port = free_port()
+    env = {**os.environ, "STRIKERBOT_WORK_DIR": str(scratch / "work"), "STRIKERBOT_STATE_DIR": str(scratch / "state")}
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "api_server:app", "--host", "127.0.0.1", "--port", str(port),
+         "--workers", str(workers), "--log-level", "warning"],
+        cwd=REPO_ROOT, env=env
+    )
+    url = f"http://127.0.0.1:{port}"
+    for _ in range(100):
+        try:
+            if httpx.get(f"{url}/ping", timeout=1).status_code == 200:
+                return server, url
+        except httpx.HTTPError:
+            pass
+        if server.poll() is not None:
+            break
+        time.sleep(0.1)
+    server.terminate()
+    raise SystemExit("uvicorn did not start")
+
+
+# --- run --------------------------------------------------------------------
+
+async def run_load(client, args, builders, mix, pipeline: Optional[Callable]) -> Dict:
+    samples: List[Tuple[str, float, float, bool]] = []
+    started = time.perf_counter()
+    deadline = started + args.duration
+    clients = [asyncio.create_task(client_loop(client, builders, mix, deadline, samples, args.seed + i))
+               for i in range(args.concurrency)]
+
+    pipeline_result = None
+    if pipeline is not None:
+        await asyncio.sleep(args.duration / 3)
+        pipeline_result = await pipeline()
+    await asyncio.gather(*clients)
+    finished = time.perf_counter()
+
+    result = {"all": report(samples, started, finished)}
+    if pipeline_result is not None:
+        window = (pipeline_result["started"], pipeline_result["finished"])
+        during = [sample for sample in samples if window[0] <= sample[1] < window[1]]
+        outside = [sample for sample in samples if not window[0] <= sample[1] < window[1]]
+        result["outside_pipeline"] = report(outside, started, finished - (window[1] - window[0]))
+        result["during_pipeline"] = report(during, *window)
+        result["pipeline"] = {
+            "ok": pipeline_result["ok"],
+            "seconds": round(window[1] - window[0], 3),
+            "overran_load": window[1] > deadline
+        }
+    return result
+
+
+def print_report(result: Dict):
+    for section in ("all", "outside_pipeline", "during_pipeline"):
+        if section not in result:
+            continue
+        print(f"\n{section.replace('_', ' ')}")
+        rows = [("overall", result[section]["overall"])] + list(result[section]["by_type"].items())
+        for name, stats in rows:
+            if not stats["requests"]:
+                continue
+            print(f"  {name:14} n={stats['requests']:6} err={stats['errors']:4}  {stats['throughput_rps']:8.1f} req/s"
+                  f"  p50 {stats['p50_ms']:8.2f}  p95 {stats['p95_ms']:8.2f}  p99 {stats['p99_ms']:8.2f}"
+                  f"  max {stats['max_ms']:8.2f} ms")
+    if "pipeline" in result:
+        pipeline = result["pipeline"]
+        print(f"\npipeline {'ok' if pipeline['ok'] else 'FAILED'} in {pipeline['seconds']:.2f} s"
+              + (" (ran past the end of the load)" if pipeline["overran_load"] else ""))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="StrikerBot API load test")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=20.0, help="seconds of load")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="weighted request types, e.g. live-matches=4,status=1")
+    parser.add_argument("--files", type=int, default=50, help="synthetic vault files")
+    parser.add_argument("--matches", type=int, default=1000, help="matches per vault file")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--pipeline", action="store_true", help="run a pipeline during the load")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--uvicorn", action="store_true", help="serve the scratch tree from a local uvicorn")
+    target.add_argument("--url", help="load an already running server instead")
+    parser.add_argument("--server-workers", type=int, default=1, help="uvicorn worker processes with --uvicorn")
+    parser.add_argument("--admin-key", default=os.getenv("ADMIN_KEY", "FLAMEBOUND_DEV_TEAM_2025"))
+    parser.add_argument("--output", type=Path, help="write the report as JSON")
+    args = parser.parse_args()
+
+    import httpx
+
+    builders = request_builders(args.files, args.matches, args.admin_key)
+    mix = parse_mix(args.mix, builders)
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+
+    with tempfile.TemporaryDirectory(prefix="strikerbot_load_") as scratch:
+        scratch = Path(scratch)
+        server = None
+        if args.url:
+            mode, base_url, api_server = "url", args.url, None
+        else:
+            api_server = prepare_tree(scratch, args.files, args.matches, args.seed)
+            if args.uvicorn:
+                server, base_url = start_uvicorn(scratch, args.server_workers)
+                mode = "uvicorn"
+            else:
+                mode, base_url = "in-process", "http://load"
+                builders = request_builders(args.files, args.matches, api_server.ADMIN_KEY)
+
+        async def run() -> Dict:
+            if mode == "in-process":
+                client = httpx.AsyncClient(transport=httpx.ASGITransport(app=api_server.app), base_url=base_url)
+            else:
+                client = httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30)
+            async with client:
+                pipeline = None
+                if args.pipeline and mode == "in-process":
+                    pipeline = lambda: in_process_pipeline(api_server, args.files, args.matches, args.seed)
+                elif args.pipeline:
+                    vault_dir = api_server.VAULT_DIR if mode == "uvicorn" else None
+                    pipeline = lambda: remote_pipeline(client, args.admin_key, vault_dir, args.files,
+                                                       args.matches, args.seed)
+                return await run_load(client, args, builders, mix, pipeline)
+
+        try:
+            result = asyncio.run(run())
+        finally:
+            if server is not None:
+                server.terminate()
+                server.wait(timeout=10)
+
+    result["config"] = {
+        "mode": mode,
+        "url": base_url if mode != "in-process" else None,
+        "concurrency": args.concurrency,
+        "duration": args.duration,
+        "mix": mix,
+        "vault": None if mode == "url" else {"files": args.files, "matches_per_file": args.matches},
+        "server_workers": args.server_workers if mode == "uvicorn" else None,
+        "cpu_count": os.cpu_count()
+    }
+    print(f"{mode} load: {args.concurrency} clients for {args.duration:.0f} s, mix {args.mix}")
+    print_report(result)
+    if args.output:
+        args.output.write_text(json.dumps(result, indent=2))
+        print(f"\nwrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
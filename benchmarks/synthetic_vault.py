@@ -0,0 +1,113 @@
+# Deterministic synthetic vaults (N files x M matches) and GT dashboard snapshots for benchmarks
+#
+#   python benchmarks/synthetic_vault.py OUTPUT_DIR [files=100] [matches_per_file=1000] [--ndjson] [--seed 7]
+#
+# The same seed, file count and match count always produce byte-identical
+# files, so timings from different releases are measured on the same input.
+import argparse
+import random
+import sys
+from array import array
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import fast_json  # noqa: E402
+import vault_format  # noqa: E402
+
+TEAMS = ["Real Madrid", "Barcelona", "Arsenal", "Chelsea", "Man City", "Man United", "Liverpool", "Atletico",
+         "Bayern", "Dortmund", "Inter", "Juventus", "Milan", "Napoli", "Porto", "Benfica", "Ajax", "Celtic"]
+PLAYERS = [f"{name}{i:02d}" for name in ("Striker", "Flame", "Volt", "Nova", "Blaze") for i in range(40)]
+LEAGUES = ["GT League", "GT League", "GT League", "Champions Cup", "Elite Division"]
+STATUSES = ["finished"] * 7 + ["scheduled", "scheduled", "live"]
+SEASON_START = date(2025, 1, 1)
+
+
+def make_match(rng: random.Random, match_id: str) -> Dict:
+    home, away = rng.sample(TEAMS, 2)
+    day = SEASON_START + timedelta(days=rng.randrange(365))
+    status = rng.choice(STATUSES)
+    match = {
+        "match_id": match_id,
+        "home_team": home,
+        "away_team": away,
+        "home_player": rng.choice(PLAYERS),
+        "away_player": rng.choice(PLAYERS),
+        "date": day.isoformat(),
+        "day": day.strftime("%A"),
+        "kickoff_time": f"{rng.randrange(24):02d}:{rng.choice((0, 12, 24, 36, 48)):02d}",
+        "status": status,
+        "league": rng.choice(LEAGUES)
+    }
+    if status != "scheduled":
+        home_goals, away_goals = rng.choices(range(7), weights=(14, 24, 24, 17, 11, 6, 4), k=2)
+        match.update({
+            "home_score": home_goals,
+            "away_score": away_goals,
+            "total_goals": home_goals + away_goals,
+            "winner_tag": "HOME" if home_goals > away_goals else "AWAY" if away_goals > home_goals else "TIE"
+        })
+    return match
+
+
+def make_file_matches(file_index: int, matches_per_file: int, seed: int = 7) -> List[Dict]:
+    """Matches of one vault file; each file has its own stream so files can be regenerated alone"""
+    rng = random.Random(f"{seed}:{file_index}")
+    return [make_match(rng, f"GT_{file_index:05d}_{i:06d}") for i in range(matches_per_file)]
+
+
+def write_vault(vault_dir: Path, files: int, matches_per_file: int, seed: int = 7, ndjson: bool = False) -> List[Path]:
+    """Write files x matches_per_file matches as vault_NNNNN.json (or .ndjson plus .idx)"""
+    vault_dir.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for file_index in range(files):
+        matches = make_file_matches(file_index, matches_per_file, seed)
+        if ndjson:
+            path = vault_dir / f"vault_{file_index:05d}{vault_format.NDJSON_SUFFIX}"
+            offsets = array('Q')
+            with open(path, 'wb') as f:
+                for match in matches:
+                    offsets.append(f.tell())
+                    f.write(fast_json.dumps(match))
+                    f.write(b"\n")
+            vault_format.write_index(path, offsets)
+        else:
+            path = vault_dir / f"vault_{file_index:05d}.json"
+            fast_json.dump_file(matches, path)
+        paths.append(path)
+    return paths
+
+
+def dashboard_html(rows: int, seed: int = 7, now: Optional[datetime] = None) -> str:
+    """A GT Leagues dashboard snapshot whose fixture rows all fall in run_parser's two-hour window"""
+    rng = random.Random(f"{seed}:dashboard")
+    now = now or datetime.now()
+    lines = ["<html><body><table class='fixtures'>",
+             "<tr><th>Time</th><th>Home</th><th></th><th>Away</th><th>Status</th><th>TV</th></tr>"]
+    for _ in range(rows):
+        home, away = rng.sample(TEAMS, 2)
+        kickoff = (now + timedelta(minutes=rng.randrange(1, 110))).strftime("%H:%M")
+        lines.append(f"<tr><td>{kickoff}</td><td>{home}</td><td>vs</td><td>{away}</td>"
+                     f"<td>{rng.choice(['Not started', 'Live', 'Finished'])}</td><td>TV{rng.randrange(1, 5)}</td></tr>")
+    lines.append("</table></body></html>")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write a deterministic synthetic vault")
+    parser.add_argument("output", type=Path)
+    parser.add_argument("files", nargs="?", type=int, default=100)
+    parser.add_argument("matches_per_file", nargs="?", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--ndjson", action="store_true", help="write NDJSON files with offset indexes")
+    args = parser.parse_args()
+
+    paths = write_vault(args.output, args.files, args.matches_per_file, args.seed, args.ndjson)
+    size = sum(path.stat().st_size for path in paths)
+    print(f"wrote {len(paths)} files, {args.files * args.matches_per_file:,} matches, {size / 1e6:.1f} MB to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+# Shared JSON layer: orjson when installed, the standard library otherwise
+import json
+import os
+from pathlib import Path
+from typing import Any, Union
+
+# STRIKERBOT_JSON_BACKEND=json forces the standard library (e.g. to compare outputs)
+JSON_BACKEND = os.getenv("STRIKERBOT_JSON_BACKEND", "orjson")
+
+try:
+    if JSON_BACKEND != "orjson":
+        raise ImportError(JSON_BACKEND)
+    import orjson
+except ImportError:
+    orjson = None
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+
+def _default(value: Any) -> Any:
+    # numpy scalars and arrays, then anything else by its string form
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    return str(value)
+
+
+if orjson is not None:
+    _OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(obj: Any, sort_keys: bool = False) -> bytes:
+        """Compact UTF-8 encoding"""
+        return orjson.dumps(obj, default=_default, option=_OPTIONS | (orjson.OPT_SORT_KEYS if sort_keys else 0))
+
+    def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        return orjson.loads(data)
+else:
+    def dumps(obj: Any, sort_keys: bool = False) -> bytes:
+        """Compact UTF-8 encoding"""
+        return json.dumps(obj, default=_default, separators=(",", ":"), ensure_ascii=False,
+                          sort_keys=sort_keys).encode("utf-8")
+
+    def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        return json.loads(bytes(data) if isinstance(data, memoryview) else data)
+
+
+def dumps_str(obj: Any, sort_keys: bool = False) -> str:
+    """Compact encoding as text (SQLite columns, SSE frames)"""
+    return dumps(obj, sort_keys).decode("utf-8")
+
+
+def load_file(path: Path) -> Any:
+    with open(path, 'rb') as f:
+        return loads(f.read())
+
+
+def dump_file(obj: Any, path: Path):
+    """Write obj to path atomically"""
+    path = Path(path)
+    tmp_file = path.with_name(path.name + ".tmp")
+    with open(tmp_file, 'wb') as f:
+        f.write(dumps(obj))
+    tmp_file.replace(path)
+
@@ -0,0 +1,135 @@
+# Cached directory sizes and file counts, refreshed incrementally by directory mtime
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+FS_STATS_MAX_AGE = float(os.getenv("FS_STATS_MAX_AGE", "60"))
+
+
+class _Directory:
+    __slots__ = ("mtime_ns", "entries", "files", "bytes", "suffixes", "subdirs", "tree_files", "tree_bytes")
+
+    def __init__(self, mtime_ns: int, entries: int, files: int, size: int, suffixes: Dict[str, int], subdirs: List[str]):
+        self.mtime_ns = mtime_ns
+        self.entries = entries
+        self.files = files
+        self.bytes = size
+        self.suffixes = suffixes
+        self.subdirs = subdirs
+        self.tree_files = files
+        self.tree_bytes = size
+
+
+class FileStats:
+    """Sizes and file counts of one or more directory trees, kept between refreshes.
+
+    A refresh stats every directory but only lists the ones whose mtime moved
+    (files added, removed or renamed), so a large unchanged tree such as .git
+    costs one stat per directory instead of one per file. Files rewritten in
+    place do not touch their directory's mtime; callers that know they wrote
+    somewhere pass it to refresh(invalidate=...). Readers only look up the
+    last completed refresh and never touch the disk.
+    """
+
+    def __init__(self, *roots: Path, max_age: float = FS_STATS_MAX_AGE):
+        self.roots = [Path(root) for root in roots]
+        self.max_age = max_age
+        self._dirs: Dict[str, _Directory] = {}
+        self._lock = threading.Lock()
+        self.refreshed_at: Optional[float] = None
+        self.refresh_seconds = 0.0
+        self.scanned = 0
+        self.reused = 0
+
+    def refresh(self, invalidate: Iterable[Path] = ()):
+        """Walk the trees again, re-listing only changed (or invalidated) directories"""
+        forced = [str(path) for path in invalidate]
+        with self._lock:
+            start = time.perf_counter()
+            dirs: Dict[str, _Directory] = {}
+            self.scanned = self.reused = 0
+            for root in self.roots:
+                self._walk(str(root), dirs, forced)
+            # Swap in the finished tree; lookups keep reading the previous one until here
+            self._dirs = dirs
+            self.refreshed_at = time.time()
+            self.refresh_seconds = time.perf_counter() - start
+
+    def _walk(self, path: str, dirs: Dict[str, _Directory], forced: List[str]) -> Optional[_Directory]:
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+        cached = self._dirs.get(path)
+        if cached is not None and cached.mtime_ns == mtime_ns and not self._is_forced(path, forced):
+            directory = _Directory(mtime_ns, cached.entries, cached.files, cached.bytes, cached.suffixes, cached.subdirs)
+            self.reused += 1
+        else:
+            directory = self._scan(path, mtime_ns)
+            self.scanned += 1
+        dirs[path] = directory
+
+        for name in directory.subdirs:
+            child = self._walk(os.path.join(path, name), dirs, forced)
+            if child is not None:
+                directory.tree_files += child.tree_files
+                directory.tree_bytes += child.tree_bytes
+        return directory
+
+    @staticmethod
+    def _is_forced(path: str, forced: List[str]) -> bool:
+        return any(path == prefix or path.startswith(prefix + os.sep) for prefix in forced)
+
+    @staticmethod
+    def _scan(path: str, mtime_ns: int) -> _Directory:
+        entries = files = size = 0
+        suffixes: Dict[str, int] = {}
+        subdirs = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    entries += 1
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.name)
+                        elif entry.is_file():
+                            files += 1
+                            size += entry.stat().st_size
+                            suffix = os.path.splitext(entry.name)[1]
+                            suffixes[suffix] = suffixes.get(suffix, 0) + 1
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        return _Directory(mtime_ns, entries, files, size, suffixes, subdirs)
+
+    def is_stale(self) -> bool:
+        return self.refreshed_at is None or time.time() - self.refreshed_at > self.max_age
+
+    def directory(self, path: Path) -> Dict:
+        """Cached figures for one directory under a root (all zero if it was missing)"""
+        directory = self._dirs.get(str(path))
+        if directory is None:
+            return {"exists": False, "entries": 0, "files": 0, "bytes": 0, "suffixes": {}, "tree_files": 0, "tree_bytes": 0}
+        return {
+            "exists": True,
+            "entries": directory.entries,
+            "files": directory.files,
+            "bytes": directory.bytes,
+            "suffixes": dict(directory.suffixes),
+            "tree_files": directory.tree_files,
+            "tree_bytes": directory.tree_bytes
+        }
+
+    def stats(self) -> Dict:
+        return {
+            "roots": [str(root) for root in self.roots],
+            "refreshed_at": self.refreshed_at,
+            "age_seconds": round(time.time() - self.refreshed_at, 1) if self.refreshed_at else None,
+            "refresh_seconds": round(self.refresh_seconds, 4),
+            "directories": len(self._dirs),
+            "scanned_dirs": self.scanned,
+            "reused_dirs": self.reused
+        }
@@ -1,9 +1,11 @@
 import asyncio
 from datetime import datetime, timedelta
 from pathlib import Path
-import json
 import os
 import re
+import time
+
+import fast_json
 
 try:
     from playwright.async_api import async_playwright
@@ -240,6 +242,7 @@ async def run():
     """Main scraper function"""
     try:
         print(f"[🛰] Starting GT Leagues scraper at {datetime.now().strftime('%H:%M:%S')}")
+        run_started = time.perf_counter()
         web_output_file = WEB_DATA_FOLDER / "gt_dashboard_latest.html"
 
         async with async_playwright() as p:
@@ -268,9 +271,12 @@ async def run():
 
             print(f"[🌐] Snapshot saved: {web_output_file} ({len(html)} chars)")
             await browser.close()
+            fetch_seconds = time.perf_counter() - run_started
 
             # Parse the content
+            parse_started = time.perf_counter()
             fixtures, players = await run_parser()
+            parse_seconds = time.perf_counter() - parse_started
             
             # Save files
             fixtures_file = WEB_DATA_FOLDER / "fixtures.json"
@@ -291,17 +297,19 @@ async def run():
                 "data_window": "2 hours from current time",
                 "source": "gtleagues.com",
                 "current_time": datetime.now().strftime("%H:%M"),
-                "debug_info": f"Scraped at {datetime.now().strftime('%H:%M:%S')}"
+                "debug_info": f"Scraped at {datetime.now().strftime('%H:%M:%S')}",
+                # Exported by the API as strikerbot_scraper_run_seconds
+                "timings": {
+                    "fetch": round(fetch_seconds, 3),
+                    "parse": round(parse_seconds, 3),
+                    "total": round(time.perf_counter() - run_started, 3)
+                }
             }
 
-            with open(fixtures_file, "w", encoding="utf-8") as f:
-                json.dump(fixtures, f, indent=2)
-
-            with open(players_file, "w", encoding="utf-8") as f:
-                json.dump(players, f, indent=2)
-                
-            with open(status_file, "w", encoding="utf-8") as f:
-                json.dump(status_data, f, indent=2)
+            # Compact, atomic writes so readers never see a half-written file
+            fast_json.dump_file(fixtures, fixtures_file)
+            fast_json.dump_file(players, players_file)
+            fast_json.dump_file(status_data, status_file)
 
             print(f"[✅] Results saved:")
             print(f"[📋] Fixtures: {len(fixtures)} matches")
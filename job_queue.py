@@ -0,0 +1,306 @@
+# Durable SQLite-backed job queue shared by every API worker process
+import asyncio
+import logging
+import os
+import socket
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import fast_json
+from async_io import run_io
+
+logger = logging.getLogger(__name__)
+
+# Attempts at recording a finished job before leaving it to the stale-job check
+FINISH_ATTEMPTS = 5
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    target TEXT,
+    force INTEGER NOT NULL DEFAULT 0,
+    profile INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL DEFAULT 'queued',
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    heartbeat_at REAL,
+    worker TEXT,
+    error TEXT,
+    phase_timings TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_status_idx ON jobs (status, id);
+CREATE TABLE IF NOT EXISTS shared_status (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+ACTIVE_STATES = ("queued", "running")
+
+
+class JobQueue:
+    """Jobs and the shared pipeline status, persisted in one SQLite file.
+
+    Every call opens a short-lived connection, so the queue can be used from
+    any thread and from several uvicorn worker processes at once. Claims run
+    inside BEGIN IMMEDIATE so only one worker can take a given job.
+    """
+
+    def __init__(self, db_path: Path, stale_after: float = 60.0):
+        self.db_path = db_path
+        self.stale_after = stale_after
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+            # Queues created before per-run profiling have no profile column
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(jobs)")}
+            if "profile" not in columns:
+                conn.execute("ALTER TABLE jobs ADD COLUMN profile INTEGER NOT NULL DEFAULT 0")
+            self._initialized = True
+        return conn
+
+    @staticmethod
+    def _job(row: Optional[sqlite3.Row]) -> Optional[Dict[str, Any]]:
+        if row is None:
+            return None
+        job = dict(row)
+        job["force"] = bool(job["force"])
+        job["profile"] = bool(job["profile"])
+        job["phase_timings"] = fast_json.loads(job["phase_timings"]) if job["phase_timings"] else {}
+        return job
+
+    def enqueue(self, kind: str, target: Optional[str] = None, force: bool = False,
+                profile: bool = False) -> Dict[str, Any]:
+        """Queue a job unless one is already queued or running.
+
+        Returns {"job": ..., "created": bool}; job is the active one when nothing was queued.
+        """
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            self._expire_stale(conn)
+            active = conn.execute(
+                "SELECT * FROM jobs WHERE status IN (?, ?) ORDER BY id LIMIT 1", ACTIVE_STATES
+            ).fetchone()
+            if active is not None:
+                conn.execute("COMMIT")
+                return {"job": self._job(active), "created": False}
+            cursor = conn.execute(
+                "INSERT INTO jobs (kind, target, force, profile, created_at) VALUES (?, ?, ?, ?, ?)",
+                (kind, target, int(force), int(profile), time.time())
+            )
+            job = conn.execute("SELECT * FROM jobs WHERE id = ?", (cursor.lastrowid,)).fetchone()
+            conn.execute("COMMIT")
+            return {"job": self._job(job), "created": True}
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def _expire_stale(self, conn: sqlite3.Connection):
+        # A running job whose worker stopped heartbeating was lost with its process
+        conn.execute(
+            "UPDATE jobs SET status = 'failed', finished_at = ?, error = 'worker lost' "
+            "WHERE status = 'running' AND heartbeat_at < ?",
+            (time.time(), time.time() - self.stale_after)
+        )
+
+    def claim(self, worker: str) -> Optional[Dict[str, Any]]:
+        """Atomically take the oldest queued job"""
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            self._expire_stale(conn)
+            row = conn.execute("SELECT id FROM jobs WHERE status = 'queued' ORDER BY id LIMIT 1").fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+            now = time.time()
+            conn.execute(
+                "UPDATE jobs SET status = 'running', worker = ?, started_at = ?, heartbeat_at = ? WHERE id = ?",
+                (worker, now, now, row["id"])
+            )
+            job = conn.execute("SELECT * FROM jobs WHERE id = ?", (row["id"],)).fetchone()
+            conn.execute("COMMIT")
+            return self._job(job)
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def heartbeat(self, job_id: int):
+        conn = self._connect()
+        try:
+            conn.execute("UPDATE jobs SET heartbeat_at = ? WHERE id = ?", (time.time(), job_id))
+        finally:
+            conn.close()
+
+    def finish(self, job_id: int, success: bool, phase_timings: Optional[Dict] = None, error: Optional[str] = None):
+        conn = self._connect()
+        try:
+            conn.execute(
+                "UPDATE jobs SET status = ?, finished_at = ?, phase_timings = ?, error = ? WHERE id = ?",
+                ("succeeded" if success else "failed", time.time(), fast_json.dumps_str(phase_timings or {}), error, job_id)
+            )
+        finally:
+            conn.close()
+
+    def get(self, job_id: int) -> Optional[Dict[str, Any]]:
+        conn = self._connect()
+        try:
+            return self._job(conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone())
+        finally:
+            conn.close()
+
+    def recent(self, limit: int = 20) -> List[Dict[str, Any]]:
+        conn = self._connect()
+        try:
+            rows = conn.execute("SELECT * FROM jobs ORDER BY id DESC LIMIT ?", (limit,)).fetchall()
+            return [self._job(row) for row in rows]
+        finally:
+            conn.close()
+
+    def active(self) -> Optional[Dict[str, Any]]:
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT * FROM jobs WHERE status IN (?, ?) ORDER BY id LIMIT 1", ACTIVE_STATES
+            ).fetchone()
+            return self._job(row)
+        finally:
+            conn.close()
+
+    def save_status(self, key: str, value: Dict):
+        conn = self._connect()
+        try:
+            conn.execute(
+                "INSERT INTO shared_status (key, value, updated_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at",
+                (key, fast_json.dumps_str(value), time.time())
+            )
+        finally:
+            conn.close()
+
+    def load_status(self, key: str) -> Optional[Dict]:
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT value FROM shared_status WHERE key = ?", (key,)).fetchone()
+            return fast_json.loads(row["value"]) if row else None
+        finally:
+            conn.close()
+
+
+class JobWorkerPool:
+    """Claims queued jobs and runs them in this process.
+
+    While a job runs, the status snapshot returned by `status_source` is
+    mirrored into the queue database so every API process serves the same view.
+    """
+
+    def __init__(self, queue: JobQueue, handler: Callable[[Dict], Awaitable[Dict]],
+                 status_source: Callable[[], Dict], status_key: str = "pipeline_status",
+                 concurrency: int = 1, poll_interval: float = 1.0, heartbeat_interval: float = 5.0):
+        self.queue = queue
+        self.handler = handler
+        self.status_source = status_source
+        self.status_key = status_key
+        self.concurrency = max(1, concurrency)
+        self.poll_interval = poll_interval
+        self.heartbeat_interval = heartbeat_interval
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self.active_jobs: Dict[int, Dict] = {}
+        self._tasks: List[asyncio.Task] = []
+        self._wakeup = asyncio.Event()
+
+    def start(self):
+        if not self._tasks:
+            self._wakeup = asyncio.Event()
+            self._tasks = [asyncio.create_task(self._worker_loop(i)) for i in range(self.concurrency)]
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def notify(self):
+        """Wake idle workers right away (a job was just queued in this process)"""
+        self._wakeup.set()
+
+    def publish_status(self):
+        self.queue.save_status(self.status_key, self.status_source())
+
+    async def _mirror_status(self, job_id: int):
+        last_payload = None
+        last_heartbeat = 0.0
+        while True:
+            # A failed write (e.g. database is locked) is retried on the next tick;
+            # a lost heartbeat would otherwise get a running job marked as failed
+            try:
+                payload = fast_json.dumps(self.status_source(), sort_keys=True)
+                if payload != last_payload:
+                    await run_io(self.publish_status)
+                    last_payload = payload
+                if time.monotonic() - last_heartbeat >= self.heartbeat_interval:
+                    await run_io(self.queue.heartbeat, job_id)
+                    last_heartbeat = time.monotonic()
+            except Exception:
+                logger.exception("Status mirror for job %s failed, retrying", job_id)
+            await asyncio.sleep(0.5)
+
+    async def _finish(self, job_id: int, success: bool, timings: Optional[Dict], error: Optional[str]):
+        """Publish the final status and record the outcome, retrying transient database errors"""
+        try:
+            await run_io(self.publish_status)
+        except Exception:
+            logger.exception("Publishing the final status of job %s failed", job_id)
+        for attempt in range(1, FINISH_ATTEMPTS + 1):
+            try:
+                await run_io(self.queue.finish, job_id, success, timings, error)
+                return
+            except Exception:
+                logger.exception("Recording job %s as finished failed (attempt %d of %d)", job_id, attempt, FINISH_ATTEMPTS)
+                if attempt < FINISH_ATTEMPTS:
+                    await asyncio.sleep(self.poll_interval * attempt)
+
+    async def _worker_loop(self, index: int):
+        worker = f"{self.worker_id}/{index}"
+        while True:
+            try:
+                job = await run_io(self.queue.claim, worker)
+            except Exception:
+                logger.exception("Claiming a job failed")
+                job = None
+            if job is None:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+                continue
+
+            self.active_jobs[job["id"]] = job
+            mirror = asyncio.create_task(self._mirror_status(job["id"]))
+            try:
+                outcome = await self.handler(job)
+                success, timings, error = outcome.get("success", False), outcome.get("phase_timings"), outcome.get("error")
+            except Exception as e:
+                success, timings, error = False, None, str(e)
+            finally:
+                mirror.cancel()
+                self.active_jobs.pop(job["id"], None)
+            await self._finish(job["id"], success, timings, error)
@@ -0,0 +1,95 @@
+# Compact columnar storage for processed matches
+import math
+import sys
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+
+class StringColumn:
+    """Dictionary-encoded string column (team names, players, dates, statuses).
+
+    Each distinct value is interned once and rows store a 32-bit code.
+    Code 0 is reserved for missing values.
+    """
+
+    def __init__(self):
+        self.values: List[Optional[str]] = [None]
+        self.codes = array('I')
+        self._lookup: Dict[str, int] = {}
+
+    def append(self, value: Any):
+        if value is None:
+            self.codes.append(0)
+            return
+        value = sys.intern(str(value))
+        code = self._lookup.get(value)
+        if code is None:
+            code = len(self.values)
+            self.values.append(value)
+            self._lookup[value] = code
+        self.codes.append(code)
+
+    def __getitem__(self, index: int) -> Optional[str]:
+        return self.values[self.codes[index]]
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+
+class MatchStore:
+    """Array-backed columns for the match fields the API reads.
+
+    Replaces the list of per-match dicts: low-cardinality strings are
+    dictionary-encoded, total_goals is a float array (NaN when missing) and
+    match IDs are kept as a plain list of strings.
+    """
+
+    STRING_FIELDS = ("home_team", "away_team", "home_player", "away_player",
+                     "date", "status", "winner_tag", "league")
+    FIELDS = ("match_id",) + STRING_FIELDS + ("total_goals",)
+
+    def __init__(self):
+        self.match_ids: List[Optional[str]] = []
+        self.columns: Dict[str, StringColumn] = {name: StringColumn() for name in self.STRING_FIELDS}
+        self.total_goals = array('d')
+
+    def __len__(self) -> int:
+        return len(self.match_ids)
+
+    def append(self, record: Dict):
+        """Add one match record (unknown fields are dropped)"""
+        match_id = record.get("match_id")
+        self.match_ids.append(str(match_id) if match_id is not None else None)
+        for name, column in self.columns.items():
+            column.append(record.get(name))
+        total_goals = record.get("total_goals")
+        try:
+            self.total_goals.append(float(total_goals) if total_goals is not None else math.nan)
+        except (TypeError, ValueError):
+            self.total_goals.append(math.nan)
+
+    def extend(self, records: Iterable[Dict]):
+        for record in records:
+            self.append(record)
+
+    def row(self, index: int) -> Dict:
+        """Materialize one match as a dict with only the fields that are set"""
+        match = {}
+        if self.match_ids[index] is not None:
+            match["match_id"] = self.match_ids[index]
+        for name, column in self.columns.items():
+            value = column[index]
+            if value is not None:
+                match[name] = value
+        total_goals = self.total_goals[index]
+        if not math.isnan(total_goals):
+            match["total_goals"] = int(total_goals) if total_goals.is_integer() else total_goals
+        return match
+
+    def rows(self, start: int = 0, stop: Optional[int] = None) -> Iterator[Dict]:
+        stop = len(self) if stop is None else min(stop, len(self))
+        for index in range(start, stop):
+            yield self.row(index)
+
+    def __iter__(self) -> Iterator[Dict]:
+        return self.rows()
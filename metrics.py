@@ -0,0 +1,274 @@
+# In-process metrics registry exported in the Prometheus text format (GET /metrics)
+import bisect
+import math
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds; request latencies sit at the low end, pipeline phases at the high end
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DURATION_BUCKETS = (0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0)
+
+LabelValues = Tuple[str, ...]
+# Callback returning current values by label values, read at export time
+Source = Callable[[], Dict[LabelValues, float]]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 source: Optional[Source] = None):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.source = source
+        self._values: Dict[LabelValues, float] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, object]) -> LabelValues:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} takes labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def values(self) -> Dict[LabelValues, float]:
+        if self.source is not None:
+            return dict(self.source())
+        with self._lock:
+            return dict(self._values)
+
+    def value(self, **labels) -> float:
+        return self.values().get(self._key(labels), 0.0)
+
+    def total(self) -> float:
+        return sum(self.values().values())
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for key, value in sorted(self.values().items()):
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(Metric):
+    kind = "gauge"
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def set_to_current_time(self, **labels):
+        self.set(time.time(), **labels)
+
+
+class Histogram(Metric):
+    """Cumulative-bucket histogram; also answers approximate quantiles for JSON reports"""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label values: [count per bucket..., count above the last bucket], [sum, count, min, max]
+        self._series: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = ([0] * (len(self.buckets) + 1), [0.0, 0, value, value])
+            counts, totals = series
+            counts[index] += 1
+            totals[0] += value
+            totals[1] += 1
+            totals[2] = min(totals[2], value)
+            totals[3] = max(totals[3], value)
+
+    def series(self) -> Dict[LabelValues, Dict]:
+        """count, sum, min, max and per-bucket (non-cumulative) counts by label values"""
+        with self._lock:
+            return {
+                key: {"counts": list(counts), "sum": totals[0], "count": totals[1], "min": totals[2], "max": totals[3]}
+                for key, (counts, totals) in self._series.items()
+            }
+
+    def values(self) -> Dict[LabelValues, float]:
+        return {key: series["count"] for key, series in self.series().items()}
+
+    def summary(self, **labels) -> Dict:
+        """count, sum, mean and p50/p95/p99 over the series matching labels (all series when none)"""
+        wanted = {self.labelnames.index(name): str(value) for name, value in labels.items()}
+        counts = [0] * (len(self.buckets) + 1)
+        total_sum, total_count = 0.0, 0
+        low, high = math.inf, -math.inf
+        for key, series in self.series().items():
+            if all(key[index] == value for index, value in wanted.items()):
+                counts = [a + b for a, b in zip(counts, series["counts"])]
+                total_sum += series["sum"]
+                total_count += series["count"]
+                low, high = min(low, series["min"]), max(high, series["max"])
+        if not total_count:
+            return {"count": 0, "sum": 0.0, "mean": None, "min": None, "max": None, "p50": None, "p95": None, "p99": None}
+        return {
+            "count": total_count,
+            "sum": round(total_sum, 6),
+            "mean": round(total_sum / total_count, 6),
+            "min": round(low, 6),
+            "max": round(high, 6),
+            "p50": self._quantile(counts, total_count, 0.50, low, high),
+            "p95": self._quantile(counts, total_count, 0.95, low, high),
+            "p99": self._quantile(counts, total_count, 0.99, low, high)
+        }
+
+    def _quantile(self, counts: List[int], total: int, q: float, low: float, high: float) -> float:
+        # Linear interpolation inside the bucket holding the q-th observation,
+        # with the observed min/max standing in for the outer bucket edges
+        rank = q * total
+        seen = 0
+        for index, count in enumerate(counts):
+            if count and seen + count >= rank:
+                lower = max(self.buckets[index - 1] if index else low, low)
+                upper = min(self.buckets[index] if index < len(self.buckets) else high, high)
+                return round(lower + (upper - lower) * (rank - seen) / count, 6)
+            seen += count
+        return round(high, 6)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        bounds = [_format_value(bound) for bound in self.buckets] + ["+Inf"]
+        for key, series in sorted(self.series().items()):
+            cumulative = 0
+            for bound, count in zip(bounds, series["counts"]):
+                cumulative += count
+                labels = _format_labels(self.labelnames, key, f'le="{bound}"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(series['sum'])}")
+            lines.append(f"{self.name}_count{labels} {series['count']}")
+        return lines
+
+
+class Registry:
+    """Named metrics of this process, rendered together for a Prometheus scrape.
+
+    Each uvicorn worker keeps its own registry, the way prometheus_client
+    does without multiprocess mode.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: Metric) -> Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} is already registered")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                source: Optional[Source] = None) -> Counter:
+        return self.register(Counter(name, documentation, labelnames, source))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+              source: Optional[Source] = None) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames, source))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def metrics(self) -> Iterable[Metric]:
+        with self._lock:
+            return list(self._metrics.values())
+
+    def render(self) -> str:
+        lines = []
+        for metric in self.metrics():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+
+class MetricsMiddleware:
+    """ASGI middleware timing every HTTP request into a histogram by method, route and status.
+
+    The route label is the matched path template (/jobs/{job_id}), so ids in
+    URLs do not create new series; unmatched paths share one label. For event
+    streams the time to the response headers is recorded instead of the
+    lifetime of the stream.
+    """
+
+    def __init__(self, app, histogram: Histogram):
+        self.app = app
+        self.histogram = histogram
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        state = {"status": 500, "recorded": False}
+
+        def record():
+            if not state["recorded"]:
+                state["recorded"] = True
+                route = scope.get("route")
+                self.histogram.observe(
+                    time.perf_counter() - start,
+                    method=scope["method"],
+                    route=getattr(route, "path", "unmatched"),
+                    status=state["status"]
+                )
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                state["status"] = message["status"]
+                headers = dict(message.get("headers") or [])
+                if headers.get(b"content-type", b"").startswith(b"text/event-stream"):
+                    record()
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                record()
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            record()
@@ -0,0 +1,177 @@
+# Opt-in per-phase profiling: cProfile of the phase's blocking work plus tracemalloc peak and top allocations
+import cProfile
+import pstats
+import threading
+import time
+import tracemalloc
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+import fast_json
+
+T = TypeVar("T")
+
+PROFILE_SUFFIX = ".prof"
+SUMMARY_SUFFIX = ".json"
+TRACEMALLOC_FRAMES = 10
+
+# The profile of the phase running in the current task; the I/O pool copies
+# the context into its threads, so every run_io call of that phase sees it
+current_profile: ContextVar[Optional["PhaseProfile"]] = ContextVar("current_profile", default=None)
+
+# tracemalloc is process-wide: started by the first profiled phase, stopped by the last
+_tracing_lock = threading.Lock()
+_tracing_users = 0
+_tracing_owned = False
+
+
+def _start_tracing():
+    global _tracing_users, _tracing_owned
+    with _tracing_lock:
+        if _tracing_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+            _tracing_owned = True
+        _tracing_users += 1
+
+
+def _stop_tracing():
+    global _tracing_users, _tracing_owned
+    with _tracing_lock:
+        _tracing_users -= 1
+        if _tracing_users == 0 and _tracing_owned:
+            tracemalloc.stop()
+            _tracing_owned = False
+
+
+def _snapshot() -> tracemalloc.Snapshot:
+    return tracemalloc.take_snapshot().filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        tracemalloc.Filter(False, "<unknown>")
+    ])
+
+
+def _function_name(key) -> str:
+    filename, line, name = key
+    return f"{filename}:{line}({name})" if line else name
+
+
+class PhaseProfile:
+    """cProfile and tracemalloc capture for one run of one phase.
+
+    The phase coroutine itself only awaits; its work runs on the I/O pool, so
+    each pool thread gets its own profiler, enabled just around the calls made
+    on behalf of this phase, and the per-thread stats are merged at the end.
+    Vault parsing in the ingest process pool shows up as waiting time only.
+    Allocation figures are process-wide, so they include anything else that
+    ran meanwhile (requests, another phase).
+    """
+
+    def __init__(self, phase: str):
+        self.phase = phase
+        self._profilers: Dict[int, cProfile.Profile] = {}
+        self._lock = threading.Lock()
+        self._start_snapshot: Optional[tracemalloc.Snapshot] = None
+        self._baseline = 0
+        self.calls = 0
+        self.started_at: Optional[float] = None
+        self.duration = 0.0
+        self.peak_bytes = 0
+        self.allocations: List[Dict[str, Any]] = []
+        self.stats: Optional[pstats.Stats] = None
+
+    def start(self):
+        self.started_at = time.time()
+        _start_tracing()
+        tracemalloc.reset_peak()
+        self._baseline = tracemalloc.get_traced_memory()[0]
+        self._start_snapshot = _snapshot()
+
+    def call(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run func under this thread's profiler"""
+        ident = threading.get_ident()
+        with self._lock:
+            profiler = self._profilers.get(ident)
+            if profiler is None:
+                profiler = self._profilers[ident] = cProfile.Profile()
+            self.calls += 1
+        profiler.enable()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profiler.disable()
+
+    def finish(self, top: int = 50):
+        """Stop capturing and keep the merged stats and the top allocations"""
+        self.duration = time.time() - self.started_at
+        try:
+            self.peak_bytes = max(tracemalloc.get_traced_memory()[1] - self._baseline, 0)
+            differences = _snapshot().compare_to(self._start_snapshot, "lineno")
+            self.allocations = [
+                {
+                    "location": str(stat.traceback),
+                    "size_bytes": stat.size_diff,
+                    "count": stat.count_diff
+                }
+                for stat in differences[:top] if stat.size_diff > 0
+            ]
+        finally:
+            self._start_snapshot = None
+            _stop_tracing()
+        with self._lock:
+            profilers = list(self._profilers.values())
+        for profiler in profilers:
+            try:
+                if self.stats is None:
+                    self.stats = pstats.Stats(profiler)
+                else:
+                    self.stats.add(profiler)
+            except TypeError:
+                continue  # nothing was recorded on that thread
+
+    def top_functions(self, sort: str, limit: int) -> List[Dict[str, Any]]:
+        if self.stats is None:
+            return []
+        column = {"cumulative": 3, "self": 2}[sort]
+        rows = sorted(self.stats.stats.items(), key=lambda item: item[1][column], reverse=True)
+        return [
+            {
+                "function": _function_name(key),
+                "calls": calls,
+                "self_seconds": round(self_time, 6),
+                "cumulative_seconds": round(cumulative, 6)
+            }
+            for key, (_, calls, self_time, cumulative, _) in rows[:limit]
+        ]
+
+    def summary(self, limit: int = 10) -> Dict[str, Any]:
+        return {
+            "started_at": self.started_at,
+            "duration": round(self.duration, 3),
+            "profiled_calls": self.calls,
+            "profiled_seconds": round(self.stats.total_tt, 3) if self.stats else 0.0,
+            "peak_bytes": self.peak_bytes,
+            "top_cumulative": self.top_functions("cumulative", limit),
+            "top_self": self.top_functions("self", limit),
+            "top_allocations": self.allocations[:limit]
+        }
+
+    def save(self, directory: Path, limit: int = 50) -> Dict[str, str]:
+        """Write <phase>.prof (pstats/snakeviz) and <phase>.json into directory"""
+        directory.mkdir(parents=True, exist_ok=True)
+        files = {"summary": str(directory / f"{self.phase}{SUMMARY_SUFFIX}")}
+        if self.stats is not None:
+            self.stats.dump_stats(str(directory / f"{self.phase}{PROFILE_SUFFIX}"))
+            files["profile"] = str(directory / f"{self.phase}{PROFILE_SUFFIX}")
+        fast_json.dump_file({"phase": self.phase, **self.summary(limit)}, directory / f"{self.phase}{SUMMARY_SUFFIX}")
+        return files
+
+
+def profiled(func: Callable[..., T]) -> Callable[..., T]:
+    """func wrapped to run under the current phase profile, if there is one"""
+    profile = current_profile.get()
+    if profile is None:
+        return func
+    return lambda *args, **kwargs: profile.call(func, *args, **kwargs)
@@ -0,0 +1,268 @@
+# Dependency-aware pipeline runner with input fingerprinting
+import asyncio
+import fcntl
+import hashlib
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Union
+
+import fast_json
+from async_io import run_io
+from phase_profiler import PhaseProfile, current_profile
+
+PhaseFunc = Callable[[], Awaitable[bool]]
+# Inputs are files (content-hashed) or version tokens of non-file inputs, e.g.
+# a results store table; outputs are files or checks that an output is present
+InputsFunc = Callable[[], Iterable[Union[Path, str]]]
+OutputsFunc = Callable[[], Iterable[Union[Path, Callable[[], bool]]]]
+
+
+class Phase:
+    """One pipeline step.
+
+    `inputs` lists the files (or version tokens) the phase reads; when it is
+    None the phase has no local inputs to fingerprint (e.g. a remote sync) and
+    always runs.
+    """
+
+    def __init__(self, name: str, func: PhaseFunc, depends_on: Sequence[str] = (),
+                 inputs: Optional[InputsFunc] = None, outputs: Optional[OutputsFunc] = None):
+        self.name = name
+        self.func = func
+        self.depends_on = tuple(depends_on)
+        self.inputs = inputs
+        self.outputs = outputs
+
+
+class PhaseResult:
+    __slots__ = ("name", "status", "duration", "fingerprint", "profile")
+
+    def __init__(self, name: str, status: str, duration: float = 0.0, fingerprint: Optional[str] = None):
+        self.name = name
+        self.status = status  # completed | skipped | failed | blocked
+        self.duration = duration
+        self.fingerprint = fingerprint
+        self.profile: Optional[PhaseProfile] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status in ("completed", "skipped")
+
+    def to_dict(self) -> Dict:
+        result = {"status": self.status, "duration": round(self.duration, 3), "fingerprint": self.fingerprint}
+        if self.profile is not None:
+            result["profile"] = self.profile.summary()
+        return result
+
+
+class PipelineEngine:
+    """Runs phases in dependency order, concurrently where the graph allows.
+
+    Each phase's inputs are fingerprinted by content hash. A phase whose
+    fingerprint matches its last successful run (and whose outputs still
+    exist) is skipped and its previous output reused. File hashes are memoized
+    per phase by (size, mtime) so unchanged files are not re-read on every run;
+    each memo only keeps the phase's current inputs.
+
+    Several worker processes may share one state file, so it is re-read for
+    every decision and changed only by read-modify-write under a file lock.
+    """
+
+    def __init__(self, phases: Sequence[Phase], state_file: Path):
+        self.phases: Dict[str, Phase] = {phase.name: phase for phase in phases}
+        self.state_file = state_file
+        for phase in phases:
+            for dep in phase.depends_on:
+                if dep not in self.phases:
+                    raise ValueError(f"Phase {phase.name} depends on unknown phase {dep}")
+        # Fingerprinting and state updates run in worker threads
+        self._lock = threading.Lock()
+
+    # --- persisted state -------------------------------------------------
+
+    def _read_state(self) -> Dict:
+        """Current contents of the state file (written atomically, so no lock is needed to read)"""
+        try:
+            state = fast_json.load_file(self.state_file)
+        except (OSError, ValueError):
+            state = {}
+        state.setdefault("phases", {})
+        state.setdefault("file_hashes", {})
+        # Older state files kept one flat memo of every path ever seen
+        if any(not isinstance(memo, dict) for memo in state["file_hashes"].values()):
+            state["file_hashes"] = {}
+        return state
+
+    @contextmanager
+    def _state_lock(self):
+        # flock serializes worker processes, the thread lock this process's phases
+        with self._lock:
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.state_file.with_name(self.state_file.name + ".lock"), 'a') as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _update_state(self, update: Callable[[Dict], None]):
+        """Apply update to the state as it is on disk now and write it back"""
+        with self._state_lock():
+            state = self._read_state()
+            update(state)
+            fast_json.dump_file(state, self.state_file)
+
+    # --- fingerprints -----------------------------------------------------
+
+    def _file_hash(self, path: Path, memo: Dict) -> str:
+        st = path.stat()
+        key = str(path)
+        cached = memo.get(key)
+        if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+            return cached[2]
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        memo[key] = [st.st_size, st.st_mtime_ns, digest.hexdigest()]
+        return memo[key][2]
+
+    def fingerprint(self, phase: Phase) -> Optional[str]:
+        """Content hash over the phase's input files and tokens (None = not fingerprintable)"""
+        if phase.inputs is None:
+            return None
+        inputs = list(phase.inputs())
+        paths = sorted({item for item in inputs if isinstance(item, Path)})
+        tokens = sorted({item for item in inputs if isinstance(item, str)})
+        digest = hashlib.sha256(phase.name.encode())
+        for token in tokens:
+            digest.update(f"{token}\n".encode())
+        memo = self._read_state()["file_hashes"].get(phase.name, {})
+        previous = dict(memo)
+        # Rebuilt from the current inputs, so files that left the vault drop out of the state
+        current = {}
+        for path in paths:
+            try:
+                file_hash = self._file_hash(path, memo)
+            except OSError:
+                continue
+            current[str(path)] = memo[str(path)]
+            digest.update(f"{path}\0{file_hash}\n".encode())
+        if current != previous:
+            def store_memo(state: Dict):
+                state["file_hashes"][phase.name] = current
+            self._update_state(store_memo)
+        return digest.hexdigest()
+
+    def _can_skip(self, phase: Phase, fingerprint: Optional[str]) -> bool:
+        if fingerprint is None:
+            return False
+        previous = self._read_state()["phases"].get(phase.name)
+        if not previous or previous.get("fingerprint") != fingerprint:
+            return False
+        outputs = list(phase.outputs()) if phase.outputs else []
+        return all(output.exists() if isinstance(output, Path) else output() for output in outputs)
+
+    # --- execution --------------------------------------------------------
+
+    def plan(self, targets: Optional[Iterable[str]] = None, with_dependencies: bool = True) -> List[str]:
+        """Phase names to run, in a valid topological order"""
+        names = list(targets) if targets is not None else list(self.phases)
+        for name in names:
+            if name not in self.phases:
+                raise KeyError(name)
+        selected = set()
+
+        def visit(name):
+            if name in selected:
+                return
+            if with_dependencies:
+                for dep in self.phases[name].depends_on:
+                    visit(dep)
+            selected.add(name)
+
+        for name in names:
+            visit(name)
+
+        ordered, placed = [], set()
+        while len(ordered) < len(selected):
+            ready = [name for name in self.phases if name in selected and name not in placed
+                     and all(dep in placed or dep not in selected for dep in self.phases[name].depends_on)]
+            if not ready:
+                raise ValueError("Pipeline has a dependency cycle")
+            ordered.extend(ready)
+            placed.update(ready)
+        return ordered
+
+    async def _run_phase(self, phase: Phase, force: bool, profile: bool,
+                         on_start: Optional[Callable], on_finish: Optional[Callable]) -> PhaseResult:
+        if on_start:
+            on_start(phase.name)
+        if not profile:
+            result = await self._execute(phase, force)
+        else:
+            # Each phase runs in its own task, so the profile only sees this phase's calls
+            phase_profile = PhaseProfile(phase.name)
+            await run_io(phase_profile.start)
+            token = current_profile.set(phase_profile)
+            try:
+                result = await self._execute(phase, force)
+            finally:
+                current_profile.reset(token)
+                await run_io(phase_profile.finish)
+            result.profile = phase_profile
+        if on_finish:
+            on_finish(phase.name, result)
+        return result
+
+    async def _execute(self, phase: Phase, force: bool) -> PhaseResult:
+        start = time.perf_counter()
+        fingerprint = await run_io(self.fingerprint, phase)
+        if not force and await run_io(self._can_skip, phase, fingerprint):
+            result = PhaseResult(phase.name, "skipped", time.perf_counter() - start, fingerprint)
+        else:
+            try:
+                success = await phase.func()
+            except Exception:
+                success = False
+            result = PhaseResult(phase.name, "completed" if success else "failed",
+                                 time.perf_counter() - start, fingerprint)
+            if success:
+                def record_success(state: Dict):
+                    state["phases"][phase.name] = {"fingerprint": fingerprint, "completed_at": time.time()}
+                await run_io(self._update_state, record_success)
+        return result
+
+    async def run(self, targets: Optional[Iterable[str]] = None, with_dependencies: bool = True,
+                  force: bool = False, profile: bool = False, on_start: Optional[Callable[[str], None]] = None,
+                  on_finish: Optional[Callable[[str, PhaseResult], None]] = None) -> Dict[str, PhaseResult]:
+        """Run the selected phases; a failed phase blocks everything downstream of it.
+
+        With profile=True every phase that runs carries a PhaseProfile on its result.
+        """
+        order = self.plan(targets, with_dependencies)
+        selected = set(order)
+        results: Dict[str, PhaseResult] = {}
+        running: Dict[asyncio.Task, str] = {}
+        waiting = list(order)
+
+        while waiting or running:
+            for name in list(waiting):
+                deps = [dep for dep in self.phases[name].depends_on if dep in selected]
+                if any(dep in results and not results[dep].ok for dep in deps):
+                    waiting.remove(name)
+                    results[name] = PhaseResult(name, "blocked")
+                    if on_finish:
+                        on_finish(name, results[name])
+                elif all(dep in results for dep in deps):
+                    waiting.remove(name)
+                    task = asyncio.create_task(self._run_phase(self.phases[name], force, profile, on_start, on_finish))
+                    running[task] = name
+            if not running:
+                continue
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                results[running.pop(task)] = task.result()
+        return {name: results[name] for name in order}
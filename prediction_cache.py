@@ -0,0 +1,93 @@
+# Bounded per-match prediction cache for the public prediction endpoints
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Optional, Tuple
+
+
+class PredictionCache:
+    """LRU cache of prediction payloads with a per-entry time to live.
+
+    Entries are tagged with the predictions generation they were built from;
+    when a new generation is seen the cache is dropped so stale payloads are
+    never served. Counters are kept so the cache can be sized from real traffic.
+    """
+
+    def __init__(self, max_entries: int = 5000, ttl: float = 900.0):
+        self.max_entries = max(1, max_entries)
+        self.ttl = ttl
+        self.generation: Optional[Hashable] = None
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.warmed = 0
+        self.warmed_at: Optional[float] = None
+
+    def _store(self, key: str, value: Any, now: float):
+        self._entries[key] = (now + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def sync_generation(self, generation: Hashable):
+        """Drop every entry if the underlying predictions changed"""
+        with self._lock:
+            if generation != self.generation:
+                self._entries.clear()
+                self.generation = generation
+
+    def get(self, key: str) -> Optional[Any]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                del self._entries[key]
+                self.expirations += 1
+            self.misses += 1
+            return None
+
+    def put(self, key: str, value: Any):
+        with self._lock:
+            self._store(key, value, time.monotonic())
+
+    def warm(self, items: Iterable[Tuple[str, Any]], generation: Hashable):
+        """Replace the contents with a fresh generation of predictions.
+
+        Items are inserted in order, so the last ones are the most recently used
+        and survive if there are more items than `max_entries`.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._entries.clear()
+            self.generation = generation
+            for key, value in items:
+                self._entries[key] = (now + self.ttl, value)
+            overflow = len(self._entries) - self.max_entries
+            for _ in range(max(0, overflow)):
+                self._entries.popitem(last=False)
+            self.warmed = len(self._entries)
+            self.warmed_at = time.time()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups * 100, 1) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "warmed": self.warmed,
+                "warmed_at": self.warmed_at
+            }
@@ -0,0 +1,135 @@
+# Vectorized batch scoring over the processed match store
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from match_store import MatchStore, StringColumn
+
+WINNER_CODES = {"HOME": 0, "AWAY": 1, "TIE": 2}
+FINISHED_STATUSES = {"finished", "ft", "full time", "completed"}
+
+# Smoothing weight (in pseudo-matches) pulling small samples towards league averages
+PRIOR_MATCHES = 5.0
+# How strongly the team-strength gap moves the winner logits
+STRENGTH_SCALE = 1.5
+
+
+def _column_codes(column: StringColumn) -> np.ndarray:
+    """Zero-copy view of a dictionary-encoded column"""
+    return np.frombuffer(column.codes, dtype=np.uint32) if len(column) else np.zeros(0, dtype=np.uint32)
+
+
+def _remap(column: StringColumn, mapping: Dict[Optional[str], int], default: int) -> np.ndarray:
+    """Translate a column's codes into a shared code space"""
+    lookup = np.array([mapping.get(value, default) for value in column.values], dtype=np.int64)
+    return lookup[_column_codes(column)]
+
+
+def _grade(confidence: np.ndarray) -> np.ndarray:
+    grades = np.array(["C WATCH", "B- WATCH", "B+ SAFE", "A- SAFE", "A+ LOCK"])
+    return grades[np.digitize(confidence, [45, 55, 65, 75])]
+
+
+class BatchPredictor:
+    """Scores every match in a MatchStore at once.
+
+    Team features come from finished matches: a smoothed win/loss strength and
+    the smoothed mean total goals of games the team played in. Winner odds are a
+    softmax over home/away/tie logits built from the strength gap; over 3.5 goals
+    is the Poisson tail of the blended expected goals of the two teams.
+    """
+
+    def __init__(self, store: MatchStore):
+        self.store = store
+
+    def features(self) -> Dict[str, np.ndarray]:
+        store = self.store
+        columns = store.columns
+        teams = sorted({v for v in columns["home_team"].values[1:]} | {v for v in columns["away_team"].values[1:]})
+        team_index = {name: i for i, name in enumerate(teams)}
+        n_teams = len(teams) + 1  # last slot collects rows with no team
+        home = _remap(columns["home_team"], team_index, n_teams - 1)
+        away = _remap(columns["away_team"], team_index, n_teams - 1)
+
+        winner = _remap(columns["winner_tag"], WINNER_CODES, -1)
+        finished_codes = {value: 1 for value in columns["status"].values if value and value.lower() in FINISHED_STATUSES}
+        finished = _remap(columns["status"], finished_codes, 0).astype(bool)
+        goals = np.frombuffer(store.total_goals, dtype=np.float64) if len(store) else np.zeros(0)
+
+        # Training rows: finished (or untagged-status) matches with a known result
+        labelled = (winner >= 0) & ~np.isnan(goals) & (finished | (_column_codes(columns["status"]) == 0))
+        h, a, w, g = home[labelled], away[labelled], winner[labelled], goals[labelled]
+
+        games = np.bincount(h, minlength=n_teams) + np.bincount(a, minlength=n_teams)
+        wins = np.bincount(h, weights=(w == 0), minlength=n_teams) + np.bincount(a, weights=(w == 1), minlength=n_teams)
+        losses = np.bincount(h, weights=(w == 1), minlength=n_teams) + np.bincount(a, weights=(w == 0), minlength=n_teams)
+        strength = (wins - losses) / (games + PRIOR_MATCHES)
+
+        league_goals = float(g.mean()) if len(g) else 3.0
+        goal_sums = np.bincount(h, weights=g, minlength=n_teams) + np.bincount(a, weights=g, minlength=n_teams)
+        team_goals = (goal_sums + PRIOR_MATCHES * league_goals) / (games + PRIOR_MATCHES)
+
+        outcome_counts = np.bincount(w, minlength=3).astype(np.float64) + 1.0  # Laplace smoothing
+        base_rates = outcome_counts / outcome_counts.sum()
+
+        return {
+            "home": home,
+            "away": away,
+            "strength_gap": strength[home] - strength[away],
+            "expected_goals": (team_goals[home] + team_goals[away]) / 2.0,
+            "base_rates": base_rates
+        }
+
+    def score(self) -> Dict[str, np.ndarray]:
+        """Winner and over/under 3.5 probabilities (percent) for every row"""
+        f = self.features()
+        gap = f["strength_gap"]
+        base = np.log(f["base_rates"])
+        logits = np.column_stack([
+            base[0] + STRENGTH_SCALE * gap,
+            base[1] - STRENGTH_SCALE * gap,
+            base[2] - STRENGTH_SCALE * np.abs(gap)
+        ])
+        logits -= logits.max(axis=1, keepdims=True)
+        winner = np.exp(logits)
+        winner /= winner.sum(axis=1, keepdims=True)
+
+        lam = np.clip(f["expected_goals"], 0.05, None)
+        under = np.exp(-lam) * (1 + lam + lam ** 2 / 2 + lam ** 3 / 6)
+        over = 1.0 - under
+
+        confidence = np.maximum(winner.max(axis=1), np.maximum(over, under)) * 100
+        return {
+            "home": np.round(winner[:, 0] * 100, 1),
+            "away": np.round(winner[:, 1] * 100, 1),
+            "tie": np.round(winner[:, 2] * 100, 1),
+            "over_3_5": np.round(over * 100, 1),
+            "under_3_5": np.round(under * 100, 1),
+            "grade": _grade(confidence)
+        }
+
+    def predictions(self, generated_at: Optional[str] = None) -> List[Dict]:
+        """Score the batch and materialize prediction records in one pass"""
+        scores = self.score()
+        generated_at = generated_at or datetime.now().isoformat()
+        columns = self.store.columns
+        home_names, away_names = columns["home_team"], columns["away_team"]
+        # tolist() converts the whole batch to Python floats in C
+        home, away, tie = scores["home"].tolist(), scores["away"].tolist(), scores["tie"].tolist()
+        over, under, grade = scores["over_3_5"].tolist(), scores["under_3_5"].tolist(), scores["grade"].tolist()
+        match_ids = self.store.match_ids
+        return [
+            {
+                "match_id": match_ids[i] if match_ids[i] is not None else f"match_{i}",
+                "home_team": home_names[i] or "Team A",
+                "away_team": away_names[i] or "Team B",
+                "predictions": {
+                    "winner": {"home": home[i], "away": away[i], "tie": tie[i]},
+                    "total_goals": {"over_3_5": over[i], "under_3_5": under[i]},
+                    "confidence": grade[i]
+                },
+                "generated_at": generated_at
+            }
+            for i in range(len(self.store))
+        ]
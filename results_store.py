@@ -0,0 +1,429 @@
+# Indexed SQLite store for processed matches, predictions and pipeline runs
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import fast_json
+from match_store import MatchStore
+from vault_stats import DEFAULT_LEAGUE
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS matches (
+    id INTEGER PRIMARY KEY,
+    match_id TEXT,
+    home_team TEXT COLLATE NOCASE,
+    away_team TEXT COLLATE NOCASE,
+    home_player TEXT,
+    away_player TEXT,
+    date TEXT,
+    day TEXT,
+    status TEXT COLLATE NOCASE,
+    winner_tag TEXT,
+    league TEXT COLLATE NOCASE NOT NULL,
+    total_goals REAL,
+    source TEXT
+);
+CREATE INDEX IF NOT EXISTS matches_match_id_idx ON matches (match_id);
+CREATE INDEX IF NOT EXISTS matches_day_idx ON matches (day, id);
+CREATE INDEX IF NOT EXISTS matches_home_team_idx ON matches (home_team, id);
+CREATE INDEX IF NOT EXISTS matches_away_team_idx ON matches (away_team, id);
+CREATE INDEX IF NOT EXISTS matches_status_idx ON matches (status, id);
+CREATE INDEX IF NOT EXISTS matches_league_idx ON matches (league, id);
+CREATE INDEX IF NOT EXISTS matches_source_idx ON matches (source);
+CREATE TABLE IF NOT EXISTS predictions (
+    id INTEGER PRIMARY KEY,
+    match_id TEXT,
+    home_team TEXT COLLATE NOCASE,
+    away_team TEXT COLLATE NOCASE,
+    generated_at TEXT,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS predictions_match_id_idx ON predictions (match_id, id);
+CREATE TABLE IF NOT EXISTS pipeline_runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp TEXT NOT NULL,
+    success INTEGER NOT NULL,
+    total_duration REAL,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS pipeline_runs_timestamp_idx ON pipeline_runs (timestamp);
+CREATE TABLE IF NOT EXISTS datasets (
+    name TEXT PRIMARY KEY,
+    version INTEGER NOT NULL,
+    updated_at REAL NOT NULL,
+    document TEXT
+);
+"""
+
+MATCH_COLUMNS = ("match_id", "home_team", "away_team", "home_player", "away_player",
+                 "date", "day", "status", "winner_tag", "league", "total_goals", "source")
+LIVE_FILTERS = ("status", "league", "date", "team")
+
+
+def _text(value: Any) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+def match_row(record: Dict, source: Optional[str] = None) -> Tuple:
+    """Column values for one vault record"""
+    date = _text(record.get("date"))
+    total_goals = record.get("total_goals")
+    try:
+        total_goals = float(total_goals) if total_goals is not None else None
+    except (TypeError, ValueError):
+        total_goals = None
+    return (
+        _text(record.get("match_id")),
+        _text(record.get("home_team")),
+        _text(record.get("away_team")),
+        _text(record.get("home_player")),
+        _text(record.get("away_player")),
+        date,
+        date[:10] if date else None,
+        _text(record.get("status")),
+        _text(record.get("winner_tag")),
+        _text(record.get("league")) or DEFAULT_LEAGUE,
+        total_goals,
+        source
+    )
+
+
+def _match_record(row: sqlite3.Row) -> Dict:
+    """Processed match dict with only the fields that are set"""
+    match = {}
+    for name in MATCH_COLUMNS:
+        if name in ("day", "source"):
+            continue
+        value = row[name]
+        if value is not None:
+            match[name] = int(value) if name == "total_goals" and value.is_integer() else value
+    return match
+
+
+def _stats_groups(conn: sqlite3.Connection, where: str, params: Sequence) -> List[Tuple[Dict, int]]:
+    # One row per (winner, goals side, league, day) instead of one per match
+    groups = []
+    for row in conn.execute(
+        "SELECT winner_tag, COALESCE(total_goals > 3.5, 0) AS over, league, day, COUNT(*) AS n "
+        f"FROM matches WHERE {where} GROUP BY winner_tag, over, league, day", params
+    ):
+        match = {"total_goals": 4 if row["over"] else 0, "league": row["league"]}
+        if row["winner_tag"] is not None:
+            match["winner_tag"] = row["winner_tag"]
+        if row["day"] is not None:
+            match["date"] = row["day"]
+        groups.append((match, row["n"]))
+    return groups
+
+
+def stored_match(row: Sequence) -> Dict:
+    """The match_row() values as the match reads back from the matches table"""
+    return _match_record(dict(zip(MATCH_COLUMNS, row)))
+
+
+class ResultsStore:
+    """Pipeline results in one SQLite file, queried directly by the API.
+
+    Like the job queue, every call opens a short-lived connection so the store
+    can be used from worker threads and several API processes. Each dataset
+    (matches, predictions, vault_stats) carries a version that is bumped in the
+    same transaction that rewrites it; readers use it for ETags and caches.
+    Read methods never create the database; runs that fail before anything
+    was stored leave no file behind.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        self._initialized = False
+
+    def _connect(self, create: bool = False, threaded: bool = False) -> Optional[sqlite3.Connection]:
+        if not create and not self.db_path.exists():
+            return None
+        if not self._initialized:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None, check_same_thread=not threaded)
+        conn.row_factory = sqlite3.Row
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+            self._initialized = True
+        return conn
+
+    @staticmethod
+    def _bump(conn: sqlite3.Connection, name: str, document: Optional[Dict] = None):
+        conn.execute(
+            "INSERT INTO datasets (name, version, updated_at, document) VALUES (?, 1, ?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET version = version + 1, updated_at = excluded.updated_at, "
+            "document = excluded.document",
+            (name, time.time(), fast_json.dumps_str(document) if document is not None else None)
+        )
+
+    # --- datasets ---------------------------------------------------------
+
+    def versions(self, names: Sequence[str]) -> Dict[str, Tuple[int, float]]:
+        """(version, updated_at) of each dataset that has been written"""
+        conn = self._connect()
+        if conn is None:
+            return {}
+        try:
+            rows = conn.execute(
+                f"SELECT name, version, updated_at FROM datasets WHERE name IN ({','.join('?' * len(names))})",
+                tuple(names)
+            ).fetchall()
+            return {row["name"]: (row["version"], row["updated_at"]) for row in rows}
+        finally:
+            conn.close()
+
+    def document(self, name: str) -> Optional[Dict]:
+        conn = self._connect()
+        if conn is None:
+            return None
+        try:
+            row = conn.execute("SELECT document FROM datasets WHERE name = ?", (name,)).fetchone()
+            return fast_json.loads(row["document"]) if row and row["document"] else None
+        finally:
+            conn.close()
+
+    # --- matches ----------------------------------------------------------
+
+    def stats_groups_from_sources(self, sources: Iterable[str]) -> List[Tuple[Dict, int]]:
+        """Matches stored for the given vault files, aggregated in SQL by the
+        fields vault stats count them under: (representative match, count) pairs
+        """
+        conn = self._connect()
+        if conn is None:
+            return []
+        try:
+            conn.execute("CREATE TEMP TABLE wanted (source TEXT PRIMARY KEY)")
+            conn.executemany("INSERT OR IGNORE INTO wanted VALUES (?)", ((s,) for s in sources))
+            return _stats_groups(conn, "source IN (SELECT source FROM wanted)", ())
+        finally:
+            conn.close()
+
+    def match_writer(self, drop_sources: Optional[Iterable[str]]) -> "MatchWriter":
+        """Open the write transaction that replaces match rows piece by piece.
+
+        `drop_sources` lists the vault files whose previous rows are removed
+        first; None drops every row (full rebuild).
+        """
+        # The transaction is driven from worker threads, one call at a time
+        conn = self._connect(create=True, threaded=True)
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            if drop_sources is None:
+                conn.execute("DELETE FROM matches")
+            else:
+                conn.executemany("DELETE FROM matches WHERE source = ?", ((s,) for s in drop_sources))
+        except Exception:
+            conn.close()
+            raise
+        return MatchWriter(self, conn)
+
+    def match_count(self) -> int:
+        conn = self._connect()
+        if conn is None:
+            return 0
+        try:
+            return conn.execute("SELECT COUNT(*) FROM matches").fetchone()[0]
+        finally:
+            conn.close()
+
+    def load_match_store(self) -> Optional[MatchStore]:
+        """Every processed match as a columnar MatchStore (for batch scoring)"""
+        conn = self._connect()
+        if conn is None:
+            return None
+        try:
+            store = MatchStore()
+            for row in conn.execute("SELECT * FROM matches ORDER BY id"):
+                store.append(_match_record(row))
+            return store
+        finally:
+            conn.close()
+
+    def live_matches(self, after_id: int, limit: int, **filters: Optional[str]) -> Tuple[List[Dict], Optional[int]]:
+        """Up to `limit` matches with id > after_id, plus the id to resume after
+        (None when exhausted). Filters are case-insensitive; date matches the day
+        """
+        conn = self._connect()
+        if conn is None:
+            return [], None
+        clauses, params = ["id > ?"], [after_id]
+        for name in LIVE_FILTERS:
+            value = filters.get(name)
+            if not value:
+                continue
+            if name == "team":
+                clauses.append("(home_team = ? OR away_team = ?)")
+                params.extend([value, value])
+            elif name == "date":
+                clauses.append("day = ?")
+                params.append(value[:10])
+            else:
+                clauses.append(f"{name} = ?")
+                params.append(value)
+        try:
+            rows = conn.execute(
+                f"SELECT * FROM matches WHERE {' AND '.join(clauses)} ORDER BY id LIMIT ?",
+                (*params, limit + 1)
+            ).fetchall()
+        finally:
+            conn.close()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        return [_match_record(row) for row in rows], rows[-1]["id"] if has_more else None
+
+    # --- predictions ------------------------------------------------------
+
+    def replace_predictions(self, predictions: List[Dict]):
+        conn = self._connect(create=True)
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("DELETE FROM predictions")
+            conn.executemany(
+                "INSERT INTO predictions (match_id, home_team, away_team, generated_at, record) VALUES (?, ?, ?, ?, ?)",
+                ((_text(p.get("match_id")), p.get("home_team"), p.get("away_team"), p.get("generated_at"),
+                  fast_json.dumps_str(p)) for p in predictions)
+            )
+            self._bump(conn, "predictions")
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def predictions_for(self, match_ids: Sequence[str]) -> Dict[str, Dict]:
+        """Prediction per match_id (the first one stored wins); unknown IDs are left out"""
+        conn = self._connect()
+        if conn is None or not match_ids:
+            return {}
+        try:
+            rows = conn.execute(
+                f"SELECT match_id, record FROM predictions WHERE match_id IN ({','.join('?' * len(match_ids))}) "
+                "ORDER BY id",
+                tuple(match_ids)
+            ).fetchall()
+        finally:
+            conn.close()
+        found = {}
+        for row in rows:
+            if row["match_id"] not in found:
+                found[row["match_id"]] = fast_json.loads(row["record"])
+        return found
+
+    def iter_predictions(self, limit: Optional[int] = None) -> Iterator[Tuple[str, Dict]]:
+        """(match_id, prediction) pairs of the `limit` most recently stored matches.
+
+        Each match gets its first stored prediction, as in predictions_for.
+        Pairs come oldest first, so the newest matches (upcoming fixtures) end
+        up most recently used when fed to PredictionCache.warm.
+        """
+        conn = self._connect()
+        if conn is None:
+            return
+        try:
+            rows = conn.execute(
+                "SELECT p.match_id, p.record FROM predictions p JOIN ("
+                "SELECT MIN(id) AS id FROM predictions WHERE match_id IS NOT NULL "
+                "GROUP BY match_id ORDER BY id DESC LIMIT ?) newest ON p.id = newest.id ORDER BY p.id",
+                (-1 if limit is None else limit,)
+            )
+            for row in rows:
+                yield row["match_id"], fast_json.loads(row["record"])
+        finally:
+            conn.close()
+
+    # --- pipeline runs ----------------------------------------------------
+
+    def record_run(self, results: Dict) -> int:
+        conn = self._connect(create=True)
+        try:
+            cursor = conn.execute(
+                "INSERT INTO pipeline_runs (timestamp, success, total_duration, record) VALUES (?, ?, ?, ?)",
+                (results["timestamp"], int(bool(results.get("success"))), results.get("total_duration"),
+                 fast_json.dumps_str(results))
+            )
+            return cursor.lastrowid
+        finally:
+            conn.close()
+
+    def recent_runs(self, limit: int = 20, since: Optional[str] = None) -> List[Dict]:
+        """Newest pipeline runs first, optionally only those at or after an ISO timestamp"""
+        conn = self._connect()
+        if conn is None:
+            return []
+        try:
+            if since:
+                rows = conn.execute(
+                    "SELECT id, record FROM pipeline_runs WHERE timestamp >= ? ORDER BY timestamp DESC LIMIT ?",
+                    (since, limit)
+                ).fetchall()
+            else:
+                rows = conn.execute(
+                    "SELECT id, record FROM pipeline_runs ORDER BY timestamp DESC LIMIT ?", (limit,)
+                ).fetchall()
+            return [{"id": row["id"], **fast_json.loads(row["record"])} for row in rows]
+        finally:
+            conn.close()
+
+    def stats(self) -> Dict[str, Any]:
+        conn = self._connect()
+        if conn is None:
+            return {"exists": False}
+        try:
+            counts = {
+                table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in ("matches", "predictions", "pipeline_runs")
+            }
+            datasets = {
+                row["name"]: {"version": row["version"], "updated_at": row["updated_at"]}
+                for row in conn.execute("SELECT name, version, updated_at FROM datasets")
+            }
+        finally:
+            conn.close()
+        return {"exists": True, "size": self.db_path.stat().st_size, "rows": counts, "datasets": datasets}
+
+
+class MatchWriter:
+    """An open transaction on the matches table (see ResultsStore.match_writer).
+
+    Rows can be streamed in as they are parsed; nothing is visible to readers
+    until commit(), which also stores the matching vault stats.
+    """
+
+    INSERT = f"INSERT INTO matches ({', '.join(MATCH_COLUMNS)}) VALUES ({', '.join('?' * len(MATCH_COLUMNS))})"
+
+    def __init__(self, store: ResultsStore, conn: sqlite3.Connection):
+        self.store = store
+        self.conn = conn
+
+    def insert(self, rows: Iterable[Tuple]):
+        self.conn.executemany(self.INSERT, rows)
+
+    def drop_source(self, source: str) -> List[Tuple[Dict, int]]:
+        """Remove the rows written so far for one vault file; returns their stats groups"""
+        groups = _stats_groups(self.conn, "source = ?", (source,))
+        self.conn.execute("DELETE FROM matches WHERE source = ?", (source,))
+        return groups
+
+    def commit(self, vault_stats: Dict) -> int:
+        """Publish the new rows and stats; returns the new match count"""
+        try:
+            self.store._bump(self.conn, "matches")
+            self.store._bump(self.conn, "vault_stats", vault_stats)
+            count = self.conn.execute("SELECT COUNT(*) FROM matches").fetchone()[0]
+            self.conn.execute("COMMIT")
+            return count
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        finally:
+            self.conn.close()
+
+    def rollback(self):
+        try:
+            self.conn.execute("ROLLBACK")
+        finally:
+            self.conn.close()
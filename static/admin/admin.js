@@ -0,0 +1,414 @@
+let adminToken = '';
+let refreshInterval = null;
+let statusStream = null;
+let watchingPipeline = false;
+let lastRunning = false;
+
+// Initialize animated background
+function initializeBackground() {
+    // Create floating particles
+    const particlesContainer = document.getElementById('particles');
+    for (let i = 0; i < 50; i++) {
+        const particle = document.createElement('div');
+        particle.className = 'particle';
+        particle.style.left = Math.random() * 100 + '%';
+        particle.style.animationDelay = Math.random() * 15 + 's';
+        particle.style.animationDuration = (Math.random() * 10 + 15) + 's';
+        particlesContainer.appendChild(particle);
+    }
+
+    // Matrix rain effect
+    const canvas = document.getElementById('matrixCanvas');
+    const ctx = canvas.getContext('2d');
+
+    function resizeCanvas() {
+        canvas.width = window.innerWidth;
+        canvas.height = window.innerHeight;
+    }
+
+    resizeCanvas();
+    window.addEventListener('resize', resizeCanvas);
+
+    const matrix = "STRIKERBOT$10NEURAL";
+    const matrixArray = matrix.split("");
+    const fontSize = 14;
+    const columns = canvas.width / fontSize;
+    const drops = [];
+
+    for (let x = 0; x < columns; x++) {
+        drops[x] = 1;
+    }
+
+    function drawMatrix() {
+        ctx.fillStyle = 'rgba(15, 15, 35, 0.04)';
+        ctx.fillRect(0, 0, canvas.width, canvas.height);
+
+        ctx.fillStyle = '#00ff88';
+        ctx.font = fontSize + 'px Orbitron';
+
+        for (let i = 0; i < drops.length; i++) {
+            const text = matrixArray[Math.floor(Math.random() * matrixArray.length)];
+            ctx.fillText(text, i * fontSize, drops[i] * fontSize);
+
+            if (drops[i] * fontSize > canvas.height && Math.random() > 0.975) {
+                drops[i] = 0;
+            }
+            drops[i]++;
+        }
+    }
+
+    setInterval(drawMatrix, 50);
+}
+
+async function login() {
+    const key = document.getElementById('adminKey').value;
+    const errorDiv = document.getElementById('loginError');
+
+    if (!key) {
+        showError('QUANTUM KEY REQUIRED FOR NEURAL ACCESS');
+        return;
+    }
+
+    try {
+        addLog('Authenticating quantum key...');
+
+        const response = await fetch('/verify', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+                'Authorization': `Bearer ${key}`
+            }
+        });
+
+        if (response.ok) {
+            adminToken = key;
+            document.getElementById('loginSection').style.display = 'none';
+            document.getElementById('commandCenter').style.display = 'block';
+            await getStatus();
+            startStatusStream();
+            addLog('NEURAL ACCESS GRANTED - Command Matrix Activated');
+            addLog('StrikerBot Neural Networks Online');
+            addLog('Quantum Operations Ready');
+            showSuccess('Welcome to StrikerBot Command Center');
+        } else {
+            showError('INVALID QUANTUM KEY - ACCESS DENIED');
+        }
+    } catch (error) {
+        showError('NEURAL CONNECTION ERROR - Retry Quantum Link');
+        addLog(`Connection error: ${error.message}`);
+    }
+}
+
+function showError(message) {
+    const errorDiv = document.getElementById('loginError');
+    errorDiv.innerHTML = message;
+    errorDiv.style.display = 'block';
+    setTimeout(() => {
+        errorDiv.style.display = 'none';
+    }, 4000);
+}
+
+function showSuccess(message) {
+    const logContent = document.getElementById('logContent');
+    const successDiv = document.createElement('div');
+    successDiv.className = 'success-message';
+    successDiv.innerHTML = message;
+    document.querySelector('.content-wrapper').insertBefore(successDiv, document.querySelector('.command-center'));
+    setTimeout(() => {
+        successDiv.remove();
+    }, 3000);
+}
+
+async function runPhase(phase) {
+    try {
+        updateButtonState(true);
+        addLog(`INITIATING NEURAL PHASE: ${phase.toUpperCase()}`);
+        addLog(`Quantum processors spinning up...`);
+
+        const response = await fetch(`/run-phase/${phase}`, {
+            method: 'POST',
+            headers: { 'Authorization': `Bearer ${adminToken}` }
+        });
+        const data = await response.json();
+
+        if (response.ok) {
+            addLog(`NEURAL PHASE ${phase.toUpperCase()} ACTIVATED`);
+            addLog(`Quantum algorithms processing...`);
+            // Progress arrives through the status stream
+        } else {
+            addLog(`NEURAL PHASE ERROR: ${data.message || 'Unknown quantum interference'}`);
+            addLog(`Check neural network connections`);
+        }
+    } catch (error) {
+        addLog(`QUANTUM LINK ERROR: ${error.message}`);
+        addLog(`Neural network temporarily offline`);
+    } finally {
+        setTimeout(() => updateButtonState(false), 3000);
+    }
+}
+
+async function runFullPipeline() {
+    try {
+        updateButtonState(true);
+        addLog('INITIALIZING COMPLETE NEURAL PIPELINE');
+        addLog('StrikerBot Master Sequence Activated');
+        addLog('Quantum processors at maximum capacity');
+        addLog('Neural networks synchronizing...');
+
+        const response = await fetch('/run-full-pipeline', {
+            method: 'POST',
+            headers: { 'Authorization': `Bearer ${adminToken}` }
+        });
+        const data = await response.json();
+
+        if (response.ok) {
+            addLog('MASTER PIPELINE SEQUENCE INITIATED');
+            addLog('Monitoring quantum operations...');
+            addLog('Real-time neural data streaming...');
+            // Completion is detected by handleStatus when the stream reports running=false
+            watchingPipeline = true;
+        } else {
+            addLog(`PIPELINE INITIALIZATION ERROR: ${data.message || 'Quantum interference detected'}`);
+            addLog('Neural system diagnostics required');
+            updateButtonState(false);
+        }
+    } catch (error) {
+        addLog(`MASTER PIPELINE ERROR: ${error.message}`);
+        addLog('Critical neural network failure');
+        updateButtonState(false);
+    }
+}
+
+async function getStatus() {
+    try {
+        const response = await fetch('/status', {
+            headers: { 'Authorization': `Bearer ${adminToken}` }
+        });
+        const data = await response.json();
+        handleStatus(data);
+        return data;
+    } catch (error) {
+        console.error('Neural status query error:', error);
+        return null;
+    }
+}
+
+function handleStatus(data) {
+    updateStatus(data);
+    if (watchingPipeline && lastRunning && !data.running) {
+        watchingPipeline = false;
+        updateButtonState(false);
+        addLog('NEURAL PIPELINE SEQUENCE COMPLETED');
+        addLog('StrikerBot predictions ready for deployment');
+        addLog('Quantum processing cycle finished');
+    }
+    lastRunning = !!data.running;
+}
+
+async function startStatusStream() {
+    if (!window.EventSource) {
+        startAutoRefresh();
+        return;
+    }
+    if (statusStream) statusStream.close();
+    statusStream = null;
+    // The stream takes a short-lived token, so the admin key never appears in a URL
+    let streamToken;
+    try {
+        const response = await fetch('/status/stream-token', {
+            method: 'POST',
+            headers: { 'Authorization': `Bearer ${adminToken}` }
+        });
+        if (!response.ok) throw new Error(`HTTP ${response.status}`);
+        streamToken = (await response.json()).token;
+    } catch (error) {
+        addLog(`Status stream unavailable (${error.message}) - falling back to polling`);
+        startAutoRefresh();
+        return;
+    }
+    // Server pushes an event only when pipeline status changes
+    statusStream = new EventSource(`/status/stream?token=${encodeURIComponent(streamToken)}`);
+    statusStream.addEventListener('status', (event) => {
+        handleStatus(JSON.parse(event.data));
+    });
+    statusStream.onerror = () => {
+        // EventSource retries on its own until the token expires; then reconnect with a new one
+        if (statusStream.readyState === EventSource.CLOSED) {
+            addLog('Status stream closed - reconnecting');
+            setTimeout(startStatusStream, 3000);
+        }
+    };
+}
+
+function updateStatus(data) {
+    const statusContent = document.getElementById('statusContent');
+    const progressBar = document.getElementById('progressBar');
+
+    if (data.progress !== undefined) {
+        progressBar.style.width = data.progress + '%';
+    }
+
+    let html = `
+        <div class="phase-grid">
+            <div class="phase-item ${data.running ? 'running' : (data.stage?.includes('error') ? 'error' : 'completed')}">
+                <div class="phase-title">Neural Status</div>
+                <div class="phase-status">${data.running ? 'NEURAL PROCESSING ACTIVE' : 'QUANTUM SYSTEMS READY'}</div>
+            </div>
+            <div class="phase-item ${data.stage?.includes('error') ? 'error' : 'completed'}">
+                <div class="phase-title">Current Operation</div>
+                <div class="phase-status">${data.stage ? data.stage.replace(/_/g, ' ').toUpperCase() : 'STANDBY'}</div>
+            </div>
+            <div class="phase-item completed">
+                <div class="phase-title">Neural Progress</div>
+                <div class="phase-status">${data.progress || 0}% QUANTUM COMPLETION</div>
+            </div>
+    `;
+
+    if (data.phases) {
+        for (const [phase, status] of Object.entries(data.phases)) {
+            const className = status.completed ? 'completed' : (data.running && data.stage?.includes(phase) ? 'running' : 'pending');
+            html += `
+                <div class="phase-item ${className}">
+                    <div class="phase-title">${phase.replace(/_/g, ' ').toUpperCase()}</div>
+                    <div class="phase-status">${status.completed ? (status.skipped ? 'UNCHANGED' : 'COMPLETE') : (className === 'running' ? 'PROCESSING' : 'QUEUED')} (${status.duration}s)</div>
+                </div>
+            `;
+        }
+    }
+
+    html += '</div>';
+
+    if (data.file_counts) {
+        html += '<div style="margin-top: 20px;"><h4 style="color: #00ff88; margin-bottom: 15px;">Quantum Data Metrics:</h4><div class="phase-grid">';
+        for (const [type, count] of Object.entries(data.file_counts)) {
+            html += `
+                <div class="phase-item completed">
+                    <div class="phase-title">${type.replace(/_/g, ' ').toUpperCase()}</div>
+                    <div class="phase-status">${count.toLocaleString()}</div>
+                </div>
+            `;
+        }
+        html += '</div></div>';
+    }
+
+    if (data.last_run) {
+        const lastRun = new Date(data.last_run).toLocaleString();
+        html += `
+            <div style="margin-top: 15px; padding: 15px; background: rgba(0, 255, 136, 0.1); border-radius: 10px; border: 1px solid rgba(0, 255, 136, 0.3);">
+                <strong style="color: #00ff88;">Last Neural Execution:</strong> ${lastRun}
+            </div>
+        `;
+    }
+
+    statusContent.innerHTML = html;
+}
+
+function updateButtonState(loading) {
+    const buttons = document.querySelectorAll('.btn');
+    buttons.forEach(btn => {
+        btn.disabled = loading;
+        if (loading) {
+            btn.style.opacity = '0.6';
+            btn.style.cursor = 'not-allowed';
+            btn.style.transform = 'none';
+        } else {
+            btn.style.opacity = '1';
+            btn.style.cursor = 'pointer';
+        }
+    });
+}
+
+function addLog(message) {
+    const logContent = document.getElementById('logContent');
+    const timestamp = new Date().toLocaleTimeString();
+    const logLine = `[${timestamp}] ${message}`;
+
+    logContent.innerHTML += logLine + '\n';
+    logContent.scrollTop = logContent.scrollHeight;
+
+    // Keep only last 100 lines for performance
+    const lines = logContent.innerHTML.split('\n');
+    if (lines.length > 100) {
+        logContent.innerHTML = lines.slice(-100).join('\n');
+    }
+}
+
+function startAutoRefresh() {
+    if (refreshInterval) clearInterval(refreshInterval);
+    refreshInterval = setInterval(() => {
+        if (adminToken && document.getElementById('commandCenter').style.display !== 'none') {
+            getStatus();
+        }
+    }, 8000);
+}
+
+// Enhanced keyboard shortcuts
+document.addEventListener('keydown', function(e) {
+    if (e.ctrlKey && e.key === 'Enter' && adminToken) {
+        runFullPipeline();
+    } else if (e.key === 'F5' && adminToken) {
+        e.preventDefault();
+        getStatus();
+        addLog('Manual neural status refresh');
+    }
+});
+
+// Admin key input handling
+document.getElementById('adminKey').addEventListener('keypress', function(e) {
+    if (e.key === 'Enter') {
+        login();
+    }
+});
+
+// Auto-focus and typing effect
+setTimeout(() => {
+    const input = document.getElementById('adminKey');
+    input.focus();
+    input.placeholder = 'ENTER QUANTUM KEY';
+
+    let placeholder = '';
+    const text = 'NEURAL ACCESS REQUIRED...';
+    let i = 0;
+
+    const typeEffect = setInterval(() => {
+        if (i < text.length) {
+            placeholder += text.charAt(i);
+            input.placeholder = placeholder;
+            i++;
+        } else {
+            clearInterval(typeEffect);
+            setTimeout(() => {
+                input.placeholder = 'ENTER QUANTUM KEY';
+            }, 1000);
+        }
+    }, 100);
+}, 1000);
+
+// Initialize everything
+window.addEventListener('load', () => {
+    initializeBackground();
+    addLog('StrikerBot Neural Network Initialized');
+    addLog('Quantum processors online');
+    addLog('Awaiting neural authentication...');
+});
+
+// Mouse interaction effects
+document.addEventListener('mousemove', (e) => {
+    const cards = document.querySelectorAll('.command-card');
+    cards.forEach(card => {
+        const rect = card.getBoundingClientRect();
+        const x = e.clientX - rect.left;
+        const y = e.clientY - rect.top;
+
+        if (x >= 0 && x <= rect.width && y >= 0 && y <= rect.height) {
+            const centerX = rect.width / 2;
+            const centerY = rect.height / 2;
+            const deltaX = (x - centerX) / centerX;
+            const deltaY = (y - centerY) / centerY;
+
+            card.style.transform = `perspective(1000px) rotateY(${deltaX * 5}deg) rotateX(${-deltaY * 5}deg) translateZ(10px)`;
+        } else {
+            card.style.transform = '';
+        }
+    });
+});
@@ -0,0 +1,100 @@
+# Precompressed static assets with strong ETags
+import gzip
+import hashlib
+from pathlib import Path
+from typing import Dict, Optional
+
+from fastapi import Request
+from fastapi.responses import Response
+
+try:
+    import brotli
+except ImportError:  # brotli is optional, gzip is always available
+    brotli = None
+
+STATIC_DIR = Path(__file__).resolve().parent / "static"
+
+# Versioned URLs never change content, the HTML shell is revalidated every load
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE = "no-cache"
+
+
+def accepted_encodings(request: Request) -> Dict[str, float]:
+    """Parse Accept-Encoding into {coding: q}"""
+    encodings = {}
+    for part in request.headers.get("accept-encoding", "").split(","):
+        coding, _, params = part.strip().partition(";")
+        if not coding:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        encodings[coding.lower()] = q
+    return encodings
+
+
+def etag_matches(request: Request, etags) -> bool:
+    """True when If-None-Match names one of the given ETags (or *)"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return "*" in candidates or any(tag in candidates for tag in etags)
+
+
+class StaticAsset:
+    """Asset body built once, with gzip/brotli variants prepared ahead of time"""
+
+    def __init__(self, content: bytes, media_type: str, cache_control: str = REVALIDATE_CACHE):
+        self.media_type = media_type
+        self.cache_control = cache_control
+        self.digest = hashlib.sha256(content).hexdigest()
+        self.version = self.digest[:12]
+        self.variants: Dict[str, bytes] = {"identity": content}
+        self.variants["gzip"] = gzip.compress(content, compresslevel=9, mtime=0)
+        if brotli is not None:
+            self.variants["br"] = brotli.compress(content, quality=11)
+        self.etags = {coding: self._etag(coding) for coding in self.variants}
+
+    def _etag(self, coding: str) -> str:
+        suffix = "" if coding == "identity" else f"-{coding}"
+        return f'"{self.digest[:32]}{suffix}"'
+
+    def _choose(self, request: Request) -> str:
+        accepted = accepted_encodings(request)
+        for coding in ("br", "gzip"):
+            if coding in self.variants and accepted.get(coding, 0) > 0:
+                return coding
+        return "identity"
+
+    def response(self, request: Request) -> Response:
+        coding = self._choose(request)
+        headers = {
+            "ETag": self.etags[coding],
+            "Cache-Control": self.cache_control,
+            "Vary": "Accept-Encoding"
+        }
+        if etag_matches(request, self.etags.values()):
+            return Response(status_code=304, headers=headers)
+        if coding != "identity":
+            headers["Content-Encoding"] = coding
+        return Response(content=self.variants[coding], media_type=self.media_type, headers=headers)
+
+
+class AdminAssets:
+    """Admin dashboard shell plus its separately cacheable CSS and JS"""
+
+    def __init__(self, directory: Path = STATIC_DIR / "admin"):
+        self.css = StaticAsset((directory / "admin.css").read_bytes(), "text/css", IMMUTABLE_CACHE)
+        self.js = StaticAsset((directory / "admin.js").read_bytes(), "application/javascript; charset=utf-8", IMMUTABLE_CACHE)
+        page = (directory / "index.html").read_text(encoding="utf-8")
+        page = page.replace("{{ADMIN_CSS_VERSION}}", self.css.version)
+        page = page.replace("{{ADMIN_JS_VERSION}}", self.js.version)
+        self.index = StaticAsset(page.encode("utf-8"), "text/html")
+
+    def get(self, name: str) -> Optional[StaticAsset]:
+        return {"admin.css": self.css, "admin.js": self.js}.get(name)
@@ -0,0 +1,82 @@
+# Server-Sent Events channel for pipeline status changes
+import asyncio
+from typing import AsyncIterator, Callable, Dict, Optional
+
+import fast_json
+from async_io import run_io
+
+
+class StatusBroadcaster:
+    """Pushes pipeline_status to subscribers only when it actually changes.
+
+    A single watcher task diffs the serialized status every `interval` seconds
+    while at least one client is connected, so idle tabs cost one heartbeat
+    comment every `heartbeat` seconds instead of a poll every 1.5s.
+    """
+
+    def __init__(self, snapshot: Callable[[], Dict], interval: float = 0.25, heartbeat: float = 20.0):
+        self._snapshot = snapshot
+        self.interval = interval
+        self.heartbeat = heartbeat
+        self.version = 0
+        self.payload = ""
+        self.subscribers = 0
+        self._changed: Optional[asyncio.Condition] = None
+        self._watcher: Optional[asyncio.Task] = None
+
+    def _serialize(self) -> str:
+        return fast_json.dumps_str(self._snapshot(), sort_keys=True)
+
+    async def _refresh(self) -> bool:
+        # The snapshot may read the shared status database, so build it off the loop
+        payload = await run_io(self._serialize)
+        if payload == self.payload:
+            return False
+        self.payload = payload
+        self.version += 1
+        return True
+
+    async def _watch(self):
+        while self.subscribers:
+            await asyncio.sleep(self.interval)
+            if await self._refresh():
+                async with self._changed:
+                    self._changed.notify_all()
+
+    async def poke(self):
+        """Publish immediately instead of waiting for the next watcher tick"""
+        if self._changed is not None and await self._refresh():
+            async with self._changed:
+                self._changed.notify_all()
+
+    def _frame(self) -> str:
+        return f"id: {self.version}\nevent: status\ndata: {self.payload}\n\n"
+
+    async def subscribe(self) -> AsyncIterator[str]:
+        """Yield SSE frames: the current status, then one frame per change"""
+        if self._changed is None:
+            self._changed = asyncio.Condition()
+        self.subscribers += 1
+        if self._watcher is None or self._watcher.done():
+            self._watcher = asyncio.create_task(self._watch())
+        try:
+            await self._refresh()
+            seen = self.version
+            yield f"retry: 3000\n{self._frame()}"
+            while True:
+                async with self._changed:
+                    try:
+                        await asyncio.wait_for(
+                            self._changed.wait_for(lambda: self.version != seen),
+                            timeout=self.heartbeat
+                        )
+                        changed = True
+                    except asyncio.TimeoutError:
+                        changed = False
+                if not changed:
+                    yield ": keepalive\n\n"
+                    continue
+                seen = self.version
+                yield self._frame()
+        finally:
+            self.subscribers -= 1
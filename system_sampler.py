@@ -0,0 +1,164 @@
+# Background sampler of process and host health (CPU, RSS, event-loop lag, fds, disk) kept in a ring buffer
+import asyncio
+import math
+import os
+import shutil
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Deque, Dict, List, Optional
+
+from async_io import run_io
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+SYSTEM_SAMPLE_INTERVAL = float(os.getenv("SYSTEM_SAMPLE_INTERVAL", "5"))
+SYSTEM_SAMPLE_WINDOW = int(os.getenv("SYSTEM_SAMPLE_WINDOW", "120"))
+
+# Numeric sample fields summarized over the window
+SAMPLE_FIELDS = ("cpu_percent", "rss_bytes", "loop_lag_ms", "open_fds", "threads", "load_avg_1m", "disk_used_percent")
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Nearest-rank percentile (q in 0-1) of an already sorted list"""
+    index = min(len(values) - 1, max(0, math.ceil(q * len(values)) - 1))
+    return values[index]
+
+
+def _existing(path: Path) -> Path:
+    # WORK_DIR may not exist before the first sync; measure the disk it will live on
+    for candidate in (path, *path.parents):
+        if candidate.exists():
+            return candidate
+    return Path("/")
+
+
+class SystemSampler:
+    """Samples the process every `interval` seconds into a ring buffer of `window` samples.
+
+    Event-loop lag is how late the sampler's own sleep wakes up, so a handler
+    blocking the loop shows up directly. Everything else is read on the I/O
+    pool. psutil is used when installed; otherwise CPU comes from os.times()
+    and RSS and open fds from /proc (None where that is unavailable).
+    """
+
+    def __init__(self, disk_path: Path, interval: float = SYSTEM_SAMPLE_INTERVAL, window: int = SYSTEM_SAMPLE_WINDOW):
+        self.disk_path = Path(disk_path)
+        self.interval = max(interval, 0.1)
+        self.samples: Deque[Dict] = deque(maxlen=max(window, 1))
+        self._task: Optional[asyncio.Task] = None
+        self._lock = threading.Lock()
+        self._process = psutil.Process() if psutil is not None else None
+        self._last_cpu: Optional[tuple] = None
+
+    # --- readers ----------------------------------------------------------
+
+    def _cpu_percent(self) -> Optional[float]:
+        # Process CPU since the previous sample, 100 = one core fully busy
+        if self._process is not None:
+            return self._process.cpu_percent(None)
+        times = os.times()
+        now = (times.user + times.system, time.monotonic())
+        previous, self._last_cpu = self._last_cpu, now
+        if previous is None or now[1] <= previous[1]:
+            return None
+        return (now[0] - previous[0]) / (now[1] - previous[1]) * 100
+
+    def _rss_bytes(self) -> Optional[int]:
+        if self._process is not None:
+            return self._process.memory_info().rss
+        try:
+            with open("/proc/self/statm") as f:
+                return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except (OSError, ValueError, IndexError):
+            return None
+
+    def _open_fds(self) -> Optional[int]:
+        if self._process is not None and hasattr(self._process, "num_fds"):
+            return self._process.num_fds()
+        try:
+            return len(os.listdir("/proc/self/fd"))
+        except OSError:
+            return None
+
+    def read(self, loop_lag: float) -> Dict:
+        """One sample (blocking; runs on the I/O pool)"""
+        with self._lock:
+            cpu_percent = self._cpu_percent()
+        try:
+            load_avg = os.getloadavg()[0]
+        except (OSError, AttributeError):
+            load_avg = None
+        disk = shutil.disk_usage(_existing(self.disk_path))
+        return {
+            "timestamp": time.time(),
+            "cpu_percent": round(cpu_percent, 1) if cpu_percent is not None else None,
+            "rss_bytes": self._rss_bytes(),
+            "loop_lag_ms": round(loop_lag * 1000, 3),
+            "open_fds": self._open_fds(),
+            "threads": threading.active_count(),
+            "load_avg_1m": load_avg,
+            "disk_used_percent": round(disk.used / disk.total * 100, 1) if disk.total else None,
+            "disk_free_bytes": disk.free
+        }
+
+    # --- background task --------------------------------------------------
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        lag = 0.0
+        while True:
+            try:
+                self.samples.append(await run_io(self.read, lag))
+            except Exception:
+                pass  # a failed read skips one sample, the sampler keeps going
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(loop.time() - expected, 0.0)
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    # --- reports ----------------------------------------------------------
+
+    def latest(self) -> Optional[Dict]:
+        return self.samples[-1] if self.samples else None
+
+    def summary(self) -> Dict:
+        """Latest sample plus p50/p95/p99/max of every field over the window"""
+        samples = list(self.samples)
+        window = {}
+        for field in SAMPLE_FIELDS:
+            values = sorted(sample[field] for sample in samples if sample.get(field) is not None)
+            if values:
+                window[field] = {
+                    "p50": percentile(values, 0.50),
+                    "p95": percentile(values, 0.95),
+                    "p99": percentile(values, 0.99),
+                    "max": values[-1]
+                }
+        return {
+            "latest": samples[-1] if samples else None,
+            "window": {
+                "samples": len(samples),
+                "seconds": round(samples[-1]["timestamp"] - samples[0]["timestamp"], 1) if samples else 0,
+                **window
+            },
+            "interval": self.interval,
+            "capacity": self.samples.maxlen,
+            "source": "psutil" if self._process is not None else "os"
+        }
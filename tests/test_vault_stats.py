@@ -0,0 +1,41 @@
+# Vault stats kept incrementally must return to zero when the matches they counted are removed
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from results_store import ResultsStore, match_row, stored_match  # noqa: E402
+from vault_stats import VaultStats, _empty_bucket  # noqa: E402
+
+RECORDS = [
+    {"match_id": "m1", "home_team": "A", "away_team": "B", "winner_tag": None, "total_goals": None, "date": None},
+    {"match_id": "m2", "home_team": "C", "away_team": "D", "winner_tag": "AWAY", "total_goals": 4, "league": None},
+    {"match_id": "m3", "home_team": "E", "away_team": "F"}
+]
+
+
+def test_add_then_remove_through_the_store_leaves_no_counts(tmp_path):
+    store = ResultsStore(tmp_path / "results.sqlite3")
+    stats = VaultStats()
+
+    writer = store.match_writer(None)
+    rows = [match_row(record, "vault.json") for record in RECORDS]
+    writer.insert(rows)
+    for row in rows:
+        stats.add(stored_match(row))
+    writer.commit(stats.to_dict())
+
+    # The vault file changed: its previous rows come back from the store and are subtracted
+    for match, count in store.stats_groups_from_sources(["vault.json"]):
+        stats.remove(match, count)
+
+    assert stats.totals == _empty_bucket()
+    assert stats.by_league == {}
+    assert stats.by_day == {}
+
+
+def test_null_fields_count_like_missing_ones():
+    with_nulls, without = VaultStats(), VaultStats()
+    with_nulls.add(stored_match(match_row(RECORDS[0], "vault.json")))
+    without.add(stored_match(match_row({"match_id": "m1", "home_team": "A", "away_team": "B"}, "vault.json")))
+    assert with_nulls.to_dict("t") == without.to_dict("t")
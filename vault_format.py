@@ -0,0 +1,215 @@
+# Line-delimited (NDJSON) vault files: memory-mapped, lazily iterated, randomly addressable
+import mmap
+import os
+import sys
+from array import array
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import fast_json
+
+NDJSON_SUFFIX = ".ndjson"
+INDEX_SUFFIX = ".idx"  # sidecar with one little-endian uint64 byte offset per record
+DEFAULT_CHUNK_BYTES = 8 * 1024 * 1024
+
+
+def index_path(path: Path) -> Path:
+    return path.with_name(path.name + INDEX_SUFFIX)
+
+
+def is_ndjson(path: Path) -> bool:
+    return path.suffix == NDJSON_SUFFIX
+
+
+def scan_vault_files(root: Path) -> Tuple[List[Path], List[Path]]:
+    """Vault files under root, plus the .ndjson files found to be stale.
+
+    An .ndjson file replaces the .json file with the same stem only while it
+    is at least as new: a .json updated after its conversion (e.g. by a git
+    sync, which leaves the untracked .ndjson in place) is read instead, and
+    the outdated .ndjson is reported as stale.
+    """
+    if not root.exists():
+        return [], []
+    files, stale = [], []
+    sources = set(root.rglob("*.json"))
+    for path in root.rglob(f"*{NDJSON_SUFFIX}"):
+        source = path.with_suffix(".json")
+        if source in sources:
+            try:
+                if path.stat().st_mtime_ns < source.stat().st_mtime_ns:
+                    stale.append(path)
+                    continue
+            except OSError:
+                pass
+            sources.discard(source)
+        files.append(path)
+    return sorted(files + list(sources)), sorted(stale)
+
+
+def list_vault_files(root: Path) -> List[Path]:
+    """Vault files under root; a current .ndjson file replaces a .json file with the same stem"""
+    return scan_vault_files(root)[0]
+
+
+class VaultReader:
+    """Read-only view of an NDJSON vault file through mmap.
+
+    Iteration decodes one line at a time, so memory stays flat however large
+    the file is. Records can be read at a byte offset directly, or by record
+    number through the .idx sidecar written by the converter (built by one
+    scan of the file when the sidecar is missing or stale).
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._file = open(self.path, 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        self.size = size
+        self._offsets: Optional[array] = None
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> "VaultReader":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _line_end(self, offset: int) -> int:
+        end = self._map.find(b"\n", offset)
+        return self.size if end == -1 else end
+
+    def scan(self, start: int = 0, end: Optional[int] = None) -> Iterator[Tuple[int, Dict]]:
+        """(offset, record) for every record whose line starts in [start, end)"""
+        if self._map is None:
+            return
+        end = self.size if end is None else min(end, self.size)
+        offset = start
+        while offset < end:
+            line_end = self._line_end(offset)
+            line = self._map[offset:line_end]
+            if line.strip():
+                record = fast_json.loads(line)
+                if isinstance(record, dict):
+                    yield offset, record
+            offset = line_end + 1
+
+    def __iter__(self) -> Iterator[Dict]:
+        for _, record in self.scan():
+            yield record
+
+    def record_at(self, offset: int) -> Dict:
+        """Decode the record whose line starts at a byte offset"""
+        if self._map is None or not 0 <= offset < self.size:
+            raise IndexError(offset)
+        return fast_json.loads(self._map[offset:self._line_end(offset)])
+
+    def offsets(self) -> array:
+        """Byte offset of every record (from the sidecar index when it is current)"""
+        if self._offsets is None:
+            self._offsets = self._load_index()
+            if self._offsets is None:
+                self._offsets = array('Q', self._scan_offsets())
+        return self._offsets
+
+    def _scan_offsets(self) -> Iterator[int]:
+        # Like scan() but without decoding; only non-blank lines count as records
+        offset = 0
+        while self._map is not None and offset < self.size:
+            line_end = self._line_end(offset)
+            if self._map[offset:line_end].strip():
+                yield offset
+            offset = line_end + 1
+
+    def _load_index(self) -> Optional[array]:
+        sidecar = index_path(self.path)
+        try:
+            if sidecar.stat().st_mtime_ns < os.fstat(self._file.fileno()).st_mtime_ns:
+                return None
+            offsets = array('Q')
+            offsets.frombytes(sidecar.read_bytes())
+        except (OSError, ValueError):
+            return None
+        if sys.byteorder != "little":
+            offsets.byteswap()
+        return offsets
+
+    def __len__(self) -> int:
+        return len(self.offsets())
+
+    def __getitem__(self, index: int) -> Dict:
+        """Record by position in the file"""
+        return self.record_at(self.offsets()[index])
+
+    def chunks(self, target_bytes: int = DEFAULT_CHUNK_BYTES) -> List[Tuple[int, int]]:
+        """Split the file into [start, end) byte ranges of about target_bytes on line boundaries"""
+        ranges = []
+        start = 0
+        while start < self.size:
+            end = min(start + target_bytes, self.size)
+            if end < self.size:
+                end = self._line_end(end - 1) + 1
+            ranges.append((start, end))
+            start = end
+        return ranges
+
+
+def write_index(path: Path, offsets: array):
+    data = array('Q', offsets)
+    if sys.byteorder != "little":
+        data.byteswap()
+    index_path(path).write_bytes(data.tobytes())
+
+
+def convert_vault_file(source: Path, target: Optional[Path] = None) -> Tuple[Path, int]:
+    """Rewrite a JSON vault file (one record or a list) as NDJSON plus its offset index.
+
+    Returns the NDJSON path and the number of records written.
+    """
+    source = Path(source)
+    target = Path(target) if target else source.with_suffix(NDJSON_SUFFIX)
+    data = fast_json.load_file(source)
+    records = data if isinstance(data, list) else [data]
+
+    offsets = array('Q')
+    tmp_file = target.with_name(target.name + ".tmp")
+    with open(tmp_file, 'wb') as f:
+        for record in records:
+            if not isinstance(record, dict):
+                continue
+            offsets.append(f.tell())
+            f.write(fast_json.dumps(record))
+            f.write(b"\n")
+    tmp_file.replace(target)
+    write_index(target, offsets)
+    return target, len(offsets)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Convert JSON vault files to memory-mappable NDJSON")
+    parser.add_argument("paths", nargs="+", type=Path, help="vault files or directories to convert")
+    parser.add_argument("--remove-source", action="store_true", help="delete each .json file once converted")
+    args = parser.parse_args()
+
+    files = []
+    for path in args.paths:
+        files.extend(sorted(path.rglob("*.json")) if path.is_dir() else [path])
+    total = 0
+    for source in files:
+        target, count = convert_vault_file(source)
+        total += count
+        if args.remove_source:
+            source.unlink()
+        print(f"{source} -> {target} ({count} records)")
+    print(f"converted {len(files)} files, {total} records")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+# Parallel vault ingestion engine
+import asyncio
+import hashlib
+import multiprocessing
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+import fast_json
+from async_io import run_io
+from vault_format import DEFAULT_CHUNK_BYTES, VaultReader, is_ndjson
+from vault_manifest import file_sha256
+
+# Ingestion tuning (Railway containers are small, so keep the defaults modest)
+VAULT_INGEST_EXECUTOR = os.getenv("VAULT_INGEST_EXECUTOR", "process")
+VAULT_INGEST_WORKERS = int(os.getenv("VAULT_INGEST_WORKERS", "0")) or min(os.cpu_count() or 1, 4)
+VAULT_INGEST_MAX_INFLIGHT_MB = int(os.getenv("VAULT_INGEST_MAX_INFLIGHT_MB", "128"))
+
+
+def parse_vault_file(path: str) -> Tuple[List[Dict], int, str]:
+    """Parse one vault file into match records (runs inside the worker pool).
+
+    Also returns the byte size and content hash of what was parsed.
+    """
+    with open(path, 'rb') as f:
+        raw = f.read()
+    data = fast_json.loads(raw)
+    records = data if isinstance(data, list) else [data]
+    return [record for record in records if isinstance(record, dict)], len(raw), hashlib.sha256(raw).hexdigest()
+
+
+def parse_vault_chunk(path: str, start: int, end: int) -> Tuple[List[Dict], int, None]:
+    """Parse one byte range of an NDJSON vault file (runs inside the worker pool)"""
+    with VaultReader(path) as reader:
+        return [record for _, record in reader.scan(start, end)], end - start, None
+
+
+def hash_vault_file(path: str) -> Tuple[List[Dict], int, str]:
+    """Content hash of a chunked vault file, read in blocks"""
+    return [], 0, file_sha256(path)
+
+
+class IngestStats:
+    """Throughput counters for one ingestion run"""
+
+    def __init__(self, total_files: int, workers: int, executor: str):
+        self.total_files = total_files
+        self.workers = workers
+        self.executor = executor
+        self.files = 0
+        self.records = 0
+        self.bytes = 0
+        self.errors = 0
+        self.started = time.perf_counter()
+        self.elapsed = 0.0
+
+    def to_dict(self) -> Dict:
+        self.elapsed = time.perf_counter() - self.started
+        elapsed = self.elapsed or 1e-9
+        return {
+            "executor": self.executor,
+            "workers": self.workers,
+            "total_files": self.total_files,
+            "files": self.files,
+            "records": self.records,
+            "bytes": self.bytes,
+            "errors": self.errors,
+            "elapsed": round(self.elapsed, 3),
+            "files_per_sec": round(self.files / elapsed, 1),
+            "records_per_sec": round(self.records / elapsed, 1)
+        }
+
+
+class VaultIngestor:
+    """Spreads vault parsing over a worker pool and streams records back.
+
+    JSON vault files are parsed whole; NDJSON files are split into byte ranges
+    of about `chunk_bytes` that are parsed independently, so even a multi-GB
+    file only has a few chunks in memory. At most `max_inflight_bytes` of
+    source data (and two tasks per worker) are in flight at once.
+
+    `stream` yields (file, records, sha256) pieces as they are parsed. A file
+    may arrive in several pieces; sha256 is only set on its last one. A file
+    that failed to parse yields (file, None, None) once and nothing after it,
+    so the caller can discard the pieces it already received.
+    """
+
+    def __init__(self, workers: int = VAULT_INGEST_WORKERS, executor: str = VAULT_INGEST_EXECUTOR,
+                 max_inflight_bytes: int = VAULT_INGEST_MAX_INFLIGHT_MB * 1024 * 1024,
+                 chunk_bytes: int = DEFAULT_CHUNK_BYTES):
+        if executor not in ("process", "thread"):
+            raise ValueError(f"Unknown ingest executor: {executor}")
+        self.workers = max(1, workers)
+        self.executor = executor
+        self.max_inflight_bytes = max_inflight_bytes
+        self.chunk_bytes = chunk_bytes
+        self.stats: Optional[IngestStats] = None
+
+    def _make_executor(self) -> Executor:
+        if self.executor == "process":
+            # The server already runs threads (I/O pool, sampler, job workers); forking it could
+            # deadlock the children, so they start from a clean forkserver instead
+            return ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context("forkserver"))
+        return ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="vault-ingest")
+
+    def _plan(self, files: Sequence[Path], remaining: Dict[Path, int]) -> List[Tuple[Path, int, tuple]]:
+        """(file, budgeted bytes, (func, *args)) for every unit of parsing work.
+
+        Stats every file and scans NDJSON files for chunk boundaries, so it
+        runs on the I/O pool rather than the event loop.
+        """
+        tasks = []
+        for path in files:
+            try:
+                if is_ndjson(path):
+                    with VaultReader(path) as reader:
+                        ranges = reader.chunks(self.chunk_bytes)
+                    tasks.extend((path, end - start, (parse_vault_chunk, str(path), start, end)) for start, end in ranges)
+                    tasks.append((path, 0, (hash_vault_file, str(path))))
+                    remaining[path] = len(ranges) + 1
+                else:
+                    tasks.append((path, path.stat().st_size, (parse_vault_file, str(path))))
+                    remaining[path] = 1
+            except OSError:
+                self.stats.errors += 1
+        return tasks
+
+    async def stream(self, files: Sequence[Path]) -> AsyncIterator[Tuple[Path, Optional[List[Dict]], Optional[str]]]:
+        """Yield (file, records, sha256) pieces in completion order"""
+        loop = asyncio.get_running_loop()
+        self.stats = stats = IngestStats(len(files), self.workers, self.executor)
+        max_tasks = self.workers * 2
+        pending: Dict[asyncio.Future, Tuple[Path, int]] = {}
+        remaining: Dict[Path, int] = {}
+        digests: Dict[Path, str] = {}
+        failed = set()
+        inflight_bytes = 0
+        queue = iter(await run_io(self._plan, files, remaining))
+        exhausted = False
+
+        executor = self._make_executor()
+        try:
+            while True:
+                # Top up the pool while staying inside the memory budget
+                while not exhausted and len(pending) < max_tasks:
+                    if pending and inflight_bytes >= self.max_inflight_bytes:
+                        break
+                    task = next(queue, None)
+                    if task is None:
+                        exhausted = True
+                        break
+                    path, size, (func, *args) = task
+                    future = loop.run_in_executor(executor, func, *args)
+                    pending[future] = (path, size)
+                    inflight_bytes += size
+
+                if not pending:
+                    break
+
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    path, size = pending.pop(future)
+                    inflight_bytes -= size
+                    remaining[path] -= 1
+                    if path in failed:
+                        continue
+                    try:
+                        records, nbytes, digest = future.result()
+                    except Exception:
+                        failed.add(path)
+                        stats.errors += 1
+                        yield path, None, None
+                        continue
+                    if digest is not None:
+                        digests[path] = digest
+                    stats.records += len(records)
+                    stats.bytes += nbytes
+                    if remaining[path]:
+                        if records:
+                            yield path, records, None
+                        continue
+                    stats.files += 1
+                    yield path, records, digests.pop(path)
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
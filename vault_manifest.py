@@ -0,0 +1,112 @@
+# Persistent manifest of processed vault files for incremental runs
+import hashlib
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import fast_json
+
+MANIFEST_FORMAT = "vault-manifest-v1"
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ManifestDiff:
+    """Vault files grouped by what an incremental run has to do with them"""
+
+    def __init__(self):
+        self.added: List[str] = []
+        self.changed: List[str] = []
+        self.deleted: List[str] = []
+        self.unchanged: List[str] = []
+
+    @property
+    def to_parse(self) -> List[str]:
+        return self.added + self.changed
+
+    @property
+    def to_drop(self) -> List[str]:
+        # Added files too: a run that died before saving the manifest may have stored their rows
+        return self.added + self.changed + self.deleted
+
+    def summary(self) -> Dict[str, int]:
+        return {
+            "added": len(self.added),
+            "changed": len(self.changed),
+            "deleted": len(self.deleted),
+            "unchanged": len(self.unchanged)
+        }
+
+
+class VaultManifest:
+    """Path, size, mtime and content hash of every vault file already merged.
+
+    Paths are stored relative to the vault root. A file whose size and mtime
+    are unchanged is trusted without reading it; otherwise its content hash
+    decides whether it really changed (e.g. a fresh checkout of the same tree).
+    """
+
+    def __init__(self, root: Path, files: Optional[Dict[str, Dict]] = None):
+        self.root = root
+        self.files: Dict[str, Dict] = files or {}
+
+    @classmethod
+    def load(cls, manifest_file: Path, root: Path) -> Optional["VaultManifest"]:
+        try:
+            data = fast_json.load_file(manifest_file)
+        except (OSError, ValueError):
+            return None
+        if data.get("format") != MANIFEST_FORMAT:
+            return None
+        return cls(root, data.get("files", {}))
+
+    def save(self, manifest_file: Path):
+        manifest_file.parent.mkdir(parents=True, exist_ok=True)
+        fast_json.dump_file({"format": MANIFEST_FORMAT, "files": self.files}, manifest_file)
+
+    def relative(self, path: Path) -> str:
+        return path.relative_to(self.root).as_posix()
+
+    def diff(self, paths: List[Path]) -> ManifestDiff:
+        """Classify the current vault files against the manifest (blocking I/O)"""
+        result = ManifestDiff()
+        seen = set()
+        for path in paths:
+            rel = self.relative(path)
+            seen.add(rel)
+            entry = self.files.get(rel)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            if entry is None:
+                result.added.append(rel)
+            elif entry["size"] == st.st_size and entry["mtime_ns"] == st.st_mtime_ns:
+                result.unchanged.append(rel)
+            elif entry["size"] == st.st_size and entry["sha256"] == file_sha256(path):
+                # Touched but identical: refresh the stat so it is not re-hashed next run
+                entry["mtime_ns"] = st.st_mtime_ns
+                result.unchanged.append(rel)
+            else:
+                result.changed.append(rel)
+        result.deleted = [rel for rel in self.files if rel not in seen]
+        return result
+
+    def record(self, rel: str, records: int, sha256: str):
+        """Remember a file that has just been parsed and merged"""
+        st = os.stat(self.root / rel)
+        self.files[rel] = {
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+            "sha256": sha256,
+            "records": records
+        }
+
+    def forget(self, rel: str):
+        self.files.pop(rel, None)
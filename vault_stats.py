@@ -0,0 +1,120 @@
+# Materialized vault statistics maintained while vault data is processed
+from datetime import datetime
+from typing import Dict, Iterable, Optional
+
+WINNER_TAGS = ("HOME", "AWAY", "TIE")
+DEFAULT_LEAGUE = "GT League"
+
+
+def _empty_bucket() -> Dict[str, int]:
+    return {"matches": 0, "HOME": 0, "AWAY": 0, "TIE": 0, "over_3_5": 0, "under_3_5": 0}
+
+
+def _percentages(bucket: Dict[str, int]) -> Dict:
+    total = bucket["matches"]
+    if not total:
+        return {
+            "winner_distribution": {tag: 0.0 for tag in WINNER_TAGS},
+            "goals_distribution": {"over_3_5": 0.0, "under_3_5": 0.0}
+        }
+    return {
+        "winner_distribution": {tag: round(bucket[tag] / total * 100, 1) for tag in WINNER_TAGS},
+        "goals_distribution": {
+            "over_3_5": round(bucket["over_3_5"] / total * 100, 1),
+            "under_3_5": round(bucket["under_3_5"] / total * 100, 1)
+        }
+    }
+
+
+def _match_keys(match: Dict):
+    winner = match.get("winner_tag", "TIE")
+    total_goals = match.get("total_goals", 0) or 0
+    try:
+        over = float(total_goals) > 3.5
+    except (TypeError, ValueError):
+        over = False
+    league = match.get("league") or DEFAULT_LEAGUE
+    day = str(match.get("date") or "")[:10] or "unknown"
+    return winner, "over_3_5" if over else "under_3_5", league, day
+
+
+class VaultStats:
+    """Additive winner/goal counters with per-league and per-day breakdowns.
+
+    Matches can be added and removed one at a time, so the aggregate can be
+    kept up to date without re-walking the processed matches.
+    """
+
+    def __init__(self):
+        self.totals = _empty_bucket()
+        self.by_league: Dict[str, Dict[str, int]] = {}
+        self.by_day: Dict[str, Dict[str, int]] = {}
+
+    def _apply(self, match: Dict, delta: int):
+        winner, goals_key, league, day = _match_keys(match)
+        buckets = (
+            self.totals,
+            self.by_league.setdefault(league, _empty_bucket()),
+            self.by_day.setdefault(day, _empty_bucket())
+        )
+        for bucket in buckets:
+            bucket["matches"] += delta
+            if winner in WINNER_TAGS:
+                bucket[winner] += delta
+            bucket[goals_key] += delta
+        # Drop empty breakdown buckets so removals do not leave stale keys
+        if not self.by_league[league]["matches"]:
+            del self.by_league[league]
+        if not self.by_day[day]["matches"]:
+            del self.by_day[day]
+
+    def add(self, match: Dict):
+        self._apply(match, 1)
+
+    def remove(self, match: Dict, count: int = 1):
+        """Take `count` matches with the same stats keys as `match` out again"""
+        self._apply(match, -count)
+
+    def add_many(self, matches: Iterable[Dict]):
+        for match in matches:
+            self._apply(match, 1)
+
+    @property
+    def total_matches(self) -> int:
+        return self.totals["matches"]
+
+    def to_dict(self, updated_at: Optional[str] = None) -> Dict:
+        """Serializable artifact with raw counts and precomputed percentages"""
+        return {
+            "total_matches": self.total_matches,
+            **_percentages(self.totals),
+            "by_league": {
+                league: {"total_matches": bucket["matches"], **_percentages(bucket)}
+                for league, bucket in sorted(self.by_league.items())
+            },
+            "by_day": {
+                day: {"total_matches": bucket["matches"], **_percentages(bucket)}
+                for day, bucket in sorted(self.by_day.items())
+            },
+            "counts": {
+                "totals": self.totals,
+                "by_league": self.by_league,
+                "by_day": self.by_day
+            },
+            "last_updated": updated_at or datetime.now().isoformat()
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "VaultStats":
+        stats = cls()
+        counts = data.get("counts", {})
+        stats.totals.update(counts.get("totals", {}))
+        stats.by_league = {k: {**_empty_bucket(), **v} for k, v in counts.get("by_league", {}).items()}
+        stats.by_day = {k: {**_empty_bucket(), **v} for k, v in counts.get("by_day", {}).items()}
+        return stats
+
+    @classmethod
+    def from_matches(cls, matches: Iterable[Dict]) -> "VaultStats":
+        stats = cls()
+        stats.add_many(matches)
+        return stats